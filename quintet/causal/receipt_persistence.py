@@ -224,6 +224,36 @@ class ReceiptStore:
 
         return receipts
 
+    def read_last_receipt(self) -> Optional[ReceiptWithHash]:
+        """
+        Read only the most recently appended receipt.
+
+        Scans raw lines but parses just the final one, unlike
+        read_all_receipts which deserializes every receipt.
+
+        Returns:
+            Last ReceiptWithHash, or None if the store is empty
+        """
+        if not self.storage_path.exists():
+            return None
+
+        last_line = None
+        with open(self.storage_path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    last_line = line
+
+        if last_line is None:
+            return None
+
+        data = json.loads(last_line)
+        return ReceiptWithHash(
+            receipt=self._deserialize_receipt(data),
+            receipt_hash=data.get("receipt_hash", ""),
+            parent_hash=data.get("parent_hash"),
+            sequence_number=data.get("sequence_number", 0)
+        )
+
     def read_recent_receipts(
         self,
         limit: int = 100,
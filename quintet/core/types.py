@@ -468,7 +468,7 @@ class Mode(Protocol):
 # RESOURCE LIMITS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ResourceLimits:
     """Resource limits per compute tier."""
     max_wall_time_ms: int
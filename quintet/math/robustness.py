@@ -365,9 +365,9 @@ def canonical_variable_order(variables: List[str]) -> List[str]:
 # TOLERANCE-BASED VERIFICATION
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class ToleranceConfig:
-    """Configuration for tolerance-based checks."""
+    """Configuration for tolerance-based checks (immutable; configs are shared)."""
     absolute: float = 1e-9      # Absolute tolerance
     relative: float = 1e-6      # Relative tolerance
     max_magnitude: float = 1e12  # Maximum reasonable value
@@ -7,7 +7,7 @@ gap detection, and promotion eligibility.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
 import sqlite3
 import json
@@ -15,6 +15,11 @@ import threading
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -158,35 +163,71 @@ class CoverageTracker:
                 cursor = conn.cursor()
 
                 # Insert test run
-                cursor.execute(
-                    """
-                    INSERT INTO test_runs
-                    (run_id, scenario_id, case_id, budget_tier, tolerance_config,
-                     passed, confidence, duration_ms, outcome, failure_reason,
-                     warnings, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_data.get("run_id"),
-                        run_data.get("scenario_id"),
-                        run_data.get("case_id"),
-                        run_data.get("budget_used", {}).get("tier"),
-                        json.dumps(run_data.get("tolerance_used", {})),
-                        run_data.get("passed", False),
-                        run_data.get("confidence", 0.0),
-                        run_data.get("duration_ms", 0.0),
-                        run_data.get("outcome"),
-                        run_data.get("failure_reason"),
-                        json.dumps(run_data.get("warnings", [])),
-                        run_data.get("timestamp", datetime.utcnow().isoformat())
-                    )
-                )
+                cursor.execute(self._INSERT_RUN_SQL, self._run_row(run_data))
 
                 # Update scenario stats
                 self._update_scenario_stats(cursor, run_data.get("scenario_id"))
 
                 conn.commit()
 
+    def record_runs_bulk(self, runs: Iterable[Dict[str, Any]]) -> None:
+        """Record many stress test runs in a single transaction.
+
+        Scenario statistics are refreshed once per affected scenario rather
+        than once per run.
+
+        Args:
+            runs: Test result dicts, each shaped like record_run's run_data
+        """
+        rows = [self._run_row(run_data) for run_data in runs]
+        if not rows:
+            return
+
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.executemany(self._INSERT_RUN_SQL, rows)
+
+                # Update scenario stats (row[1] is scenario_id)
+                for scenario_id in dict.fromkeys(row[1] for row in rows):
+                    self._update_scenario_stats(cursor, scenario_id)
+
+                conn.commit()
+
+    _INSERT_RUN_SQL = """
+        INSERT INTO test_runs
+        (run_id, scenario_id, case_id, budget_tier, tolerance_config,
+         passed, confidence, duration_ms, outcome, failure_reason,
+         warnings, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+    @staticmethod
+    def _run_row(run_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Build the test_runs row for a run.
+
+        Args:
+            run_data: Test result data
+
+        Returns:
+            Parameters for _INSERT_RUN_SQL
+        """
+        return (
+            run_data.get("run_id"),
+            run_data.get("scenario_id"),
+            run_data.get("case_id"),
+            run_data.get("budget_used", {}).get("tier"),
+            json.dumps(run_data.get("tolerance_used", {})),
+            run_data.get("passed", False),
+            run_data.get("confidence", 0.0),
+            run_data.get("duration_ms", 0.0),
+            run_data.get("outcome"),
+            run_data.get("failure_reason"),
+            json.dumps(run_data.get("warnings", [])),
+            run_data.get("timestamp", datetime.utcnow().isoformat())
+        )
+
     def _update_scenario_stats(self, cursor: sqlite3.Cursor, scenario_id: str) -> None:
         """Update scenario statistics after new run.
 
@@ -239,15 +280,51 @@ class CoverageTracker:
                 (scenario_id,)
             )
 
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "total_runs": row[0] or 0,
-                    "passed_runs": row[1] or 0,
-                    "avg_confidence": row[2] or 0.0,
-                    "last_run_at": row[3],
-                    "failure_rate": 1.0 - ((row[1] or 0) / (row[0] or 1))
-                }
+            return self._stats_from_row(cursor.fetchone())
+
+    def iter_scenarios_for_promotion(
+        self
+    ) -> Iterator[Tuple[str, Optional[str], Dict[str, Any]]]:
+        """Stream (scenario_id, name, stats) for every tracked scenario.
+
+        Rows are read from the cursor as they are consumed, in the same
+        order as generate_coverage_report, without building the report.
+
+        Yields:
+            Scenario ID, name, and stats shaped like get_scenario_stats
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT scenario_id, name, total_runs, passed_runs, avg_confidence, last_run_at
+                FROM scenarios
+                ORDER BY category, domain, name
+                """
+            )
+
+            for row in cursor:
+                yield row[0], row[1], self._stats_from_row(row[2:])
+
+    @staticmethod
+    def _stats_from_row(row: Optional[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """Build a stats dictionary from a (total, passed, avg_conf, last_run_at) row.
+
+        Args:
+            row: Scenario row, or None if the scenario is unknown
+
+        Returns:
+            Stats dictionary including derived failure_rate
+        """
+        if row:
+            return {
+                "total_runs": row[0] or 0,
+                "passed_runs": row[1] or 0,
+                "avg_confidence": row[2] or 0.0,
+                "last_run_at": row[3],
+                "failure_rate": 1.0 - ((row[1] or 0) / (row[0] or 1))
+            }
 
         return {
             "total_runs": 0,
@@ -388,8 +465,12 @@ class CoverageTracker:
 
             if output_path:
                 Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "w") as f:
-                    json.dump(report, f, indent=2)
+                if orjson is not None:
+                    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    Path(output_path).write_bytes(orjson.dumps(report, option=option))
+                else:
+                    with open(output_path, "w") as f:
+                        json.dump(report, f, indent=2)
                 logger.info(f"Coverage report saved to {output_path}")
 
             return report
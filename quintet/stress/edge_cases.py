@@ -7,14 +7,17 @@ support for custom edge case generators and categorization.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Callable, Optional
-import logging
+from typing import Dict, List, Any, Callable, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
 import functools
+import itertools
+import logging
+import threading
+import types
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeCase:
     """Definition of an edge case for stress testing."""
 
@@ -23,8 +26,13 @@ class EdgeCase:
     category: str         # "overflow", "underflow", "singularity", "ill_conditioned"
     description: str
     generator: Optional[Callable[[], Dict[str, Any]]] = None
-    expected_behavior: Dict[str, Any] = field(default_factory=dict)
-    tags: List[str] = field(default_factory=list)
+    expected_behavior: Optional[Dict[str, Any]] = None
+    tags: FrozenSet[str] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        """Normalize tags to a frozenset for O(1) membership tests."""
+        if not isinstance(self.tags, frozenset):
+            self.tags = frozenset(self.tags)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (excluding generator function)."""
@@ -33,8 +41,8 @@ class EdgeCase:
             "domain": self.domain,
             "category": self.category,
             "description": self.description,
-            "expected_behavior": self.expected_behavior,
-            "tags": self.tags,
+            "expected_behavior": self.expected_behavior or {},
+            "tags": sorted(self.tags),
         }
 
     def generate(self) -> Dict[str, Any]:
@@ -45,7 +53,7 @@ class EdgeCase:
         """
         if self.generator:
             return self.generator()
-        return self.expected_behavior
+        return self.expected_behavior or {}
 
 
 class EdgeCaseRegistry:
@@ -53,7 +61,17 @@ class EdgeCaseRegistry:
 
     def __init__(self):
         """Initialize registry."""
-        self._cases: Dict[str, List[EdgeCase]] = {}
+        # domain -> case_id -> EdgeCase (insertion-ordered)
+        self._cases: Dict[str, Dict[str, EdgeCase]] = {}
+        # Inverted indexes, keyed by domain: category/tag -> case_ids
+        self._by_category: Dict[str, Dict[str, Set[str]]] = {}
+        self._by_tag: Dict[str, Dict[str, Set[str]]] = {}
+        # Registration rank per case, used to keep query results in order
+        self._rank: Dict[str, Dict[str, int]] = {}
+        self._counter = itertools.count()
+        # Bumped on every register(); read-only queries are memoized per version
+        self._version = 0
+        self._read_cache: Dict[Hashable, Tuple[int, Any]] = {}
         self._logger = logger
 
     def register(self, domain: str, case: EdgeCase) -> None:
@@ -63,24 +81,66 @@ class EdgeCaseRegistry:
             domain: Problem domain
             case: EdgeCase instance
         """
-        if domain not in self._cases:
-            self._cases[domain] = []
+        cases = self._cases.setdefault(domain, {})
 
         # Check for duplicate
-        for existing in self._cases[domain]:
-            if existing.case_id == case.case_id:
-                self._logger.warning(f"Overwriting edge case: {case.case_id}")
-                self._cases[domain].remove(existing)
-                break
+        existing = cases.pop(case.case_id, None)
+        if existing is not None:
+            self._logger.warning("Overwriting edge case: %s", case.case_id)
+            self._unindex(domain, existing)
+
+        cases[case.case_id] = case
+        self._rank.setdefault(domain, {})[case.case_id] = next(self._counter)
+        self._by_category.setdefault(domain, {}).setdefault(case.category, set()).add(
+            case.case_id
+        )
+        tag_index = self._by_tag.setdefault(domain, {})
+        for tag in case.tags:
+            tag_index.setdefault(tag, set()).add(case.case_id)
+        self._version += 1
+
+        self._logger.debug("Registered edge case: %s in domain %s", case.case_id, domain)
 
-        self._cases[domain].append(case)
-        self._logger.debug(f"Registered edge case: {case.case_id} in domain {domain}")
+    def _memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return a cached read result, recomputing if the registry changed.
+
+        Args:
+            key: Cache key identifying the query
+            compute: Zero-argument function producing the result
+
+        Returns:
+            Cached or freshly computed result
+        """
+        cached = self._read_cache.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        value = compute()
+        self._read_cache[key] = (self._version, value)
+        return value
+
+    def _unindex(self, domain: str, case: EdgeCase) -> None:
+        """Remove a case from the category and tag indexes.
+
+        Args:
+            domain: Problem domain
+            case: EdgeCase being replaced
+        """
+        category_index = self._by_category[domain]
+        category_index[case.category].discard(case.case_id)
+        if not category_index[case.category]:
+            del category_index[case.category]
+
+        tag_index = self._by_tag[domain]
+        for tag in case.tags:
+            tag_index[tag].discard(case.case_id)
+            if not tag_index[tag]:
+                del tag_index[tag]
 
     def get_cases(
         self,
         domain: str,
         category: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[Iterable[str]] = None
     ) -> List[EdgeCase]:
         """Get edge cases by domain and optional filters.
 
@@ -90,17 +150,30 @@ class EdgeCaseRegistry:
             tags: Optional tags filter (match any)
 
         Returns:
-            List of matching EdgeCase objects
+            List of matching EdgeCase objects, in registration order
         """
-        cases = self._cases.get(domain, [])
-
-        if category:
-            cases = [c for c in cases if c.category == category]
+        cases = self._cases.get(domain)
+        if not cases:
+            return []
 
-        if tags:
-            cases = [c for c in cases if any(tag in c.tags for tag in tags)]
+        tags_set = frozenset(tags or ())
+        if not category and not tags_set:
+            return list(cases.values())
 
-        return cases
+        # Start from an index-backed candidate set, then apply the tag
+        # predicate in the same pass that builds the result
+        if category:
+            candidates = self._by_category[domain].get(category, ())
+        else:
+            tag_index = self._by_tag[domain]
+            candidates = set().union(*(tag_index.get(tag, ()) for tag in tags_set))
+
+        rank = self._rank[domain]
+        return [
+            cases[case_id]
+            for case_id in sorted(candidates, key=rank.__getitem__)
+            if not tags_set or not tags_set.isdisjoint(cases[case_id].tags)
+        ]
 
     def list_domains(self) -> List[str]:
         """Get list of registered domains.
@@ -108,7 +181,7 @@ class EdgeCaseRegistry:
         Returns:
             List of domain names
         """
-        return list(self._cases.keys())
+        return list(self._memoize("list_domains", lambda: list(self._cases.keys())))
 
     def list_categories(self, domain: str) -> List[str]:
         """Get unique categories for a domain.
@@ -119,9 +192,10 @@ class EdgeCaseRegistry:
         Returns:
             List of category names
         """
-        cases = self._cases.get(domain, [])
-        categories = set(c.category for c in cases)
-        return sorted(list(categories))
+        def compute() -> List[str]:
+            return sorted({c.category for c in self._cases.get(domain, {}).values()})
+
+        return list(self._memoize(("list_categories", domain), compute))
 
     def count_cases(self, domain: Optional[str] = None) -> int:
         """Count total edge cases.
@@ -132,9 +206,12 @@ class EdgeCaseRegistry:
         Returns:
             Number of edge cases
         """
-        if domain:
-            return len(self._cases.get(domain, []))
-        return sum(len(cases) for cases in self._cases.values())
+        def compute() -> int:
+            if domain:
+                return len(self._cases.get(domain, {}))
+            return sum(len(cases) for cases in self._cases.values())
+
+        return self._memoize(("count_cases", domain), compute)
 
     def export(self, domain: Optional[str] = None) -> Dict[str, Any]:
         """Export registry data.
@@ -146,20 +223,21 @@ class EdgeCaseRegistry:
             Dictionary with case data
         """
         if domain:
-            cases = self._cases.get(domain, [])
+            cases = self._cases.get(domain, {})
             return {
-                domain: [c.to_dict() for c in cases]
+                domain: [c.to_dict() for c in cases.values()]
             }
 
         result = {}
         for d, cases in self._cases.items():
-            result[d] = [c.to_dict() for c in cases]
+            result[d] = [c.to_dict() for c in cases.values()]
 
         return result
 
 
 # Global singleton registry
 _registry: Optional[EdgeCaseRegistry] = None
+_registry_lock = threading.Lock()
 
 
 def get_edge_case_registry() -> EdgeCaseRegistry:
@@ -170,7 +248,9 @@ def get_edge_case_registry() -> EdgeCaseRegistry:
     """
     global _registry
     if _registry is None:
-        _registry = EdgeCaseRegistry()
+        with _registry_lock:
+            if _registry is None:
+                _registry = EdgeCaseRegistry()
     return _registry
 
 
@@ -179,7 +259,7 @@ def register_edge_case(
     case_id: str,
     category: str,
     description: str,
-    tags: Optional[List[str]] = None,
+    tags: Optional[Iterable[str]] = None,
     expected_behavior: Optional[Dict[str, Any]] = None
 ):
     """Decorator to register an edge case generator function.
@@ -193,7 +273,7 @@ def register_edge_case(
         expected_behavior: Optional expected behavior spec
 
     Returns:
-        Decorator function
+        Decorator that registers the generator and returns it unchanged
     """
     def decorator(generator_func: Callable[[], Dict[str, Any]]) -> Callable:
         """Decorator implementation."""
@@ -203,155 +283,169 @@ def register_edge_case(
             category=category,
             description=description,
             generator=generator_func,
-            expected_behavior=expected_behavior or {},
-            tags=tags or []
+            expected_behavior=expected_behavior,
+            tags=frozenset(tags or ())
         )
 
         registry = get_edge_case_registry()
         registry.register(domain, case)
 
-        @functools.wraps(generator_func)
-        def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
-            return generator_func(*args, **kwargs)
-
-        return wrapper
+        return generator_func
 
     return decorator
 
 
 # Built-in edge cases for algebra domain
-
-@register_edge_case(
-    domain="algebra",
-    case_id="overflow_quadratic",
-    category="overflow",
-    description="Quadratic equation with coefficients near float64 max",
-    tags=["quadratic", "numeric_limits"],
-    expected_behavior={"outcome": "degraded_success", "confidence_min": 0.4}
-)
-def generate_overflow_quadratic() -> Dict[str, Any]:
-    """Generate overflow edge case."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["x^2 - 1e308*x + 1e307 = 0"],
-        "variables": ["x"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="underflow_quadratic",
-    category="underflow",
-    description="Quadratic equation with tiny coefficients",
-    tags=["quadratic", "numeric_limits"],
-    expected_behavior={"outcome": "degraded_success", "confidence_min": 0.4}
-)
-def generate_underflow_quadratic() -> Dict[str, Any]:
-    """Generate underflow edge case."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["1e-100*x^2 - 1e-100*x + 1e-101 = 0"],
-        "variables": ["x"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="ill_conditioned_system",
-    category="ill_conditioned",
-    description="Nearly singular linear system",
-    tags=["system", "conditioning"],
-    expected_behavior={"outcome": "degraded_success", "confidence_min": 0.5}
-)
-def generate_ill_conditioned_system() -> Dict[str, Any]:
-    """Generate ill-conditioned system."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": [
-            "x + y = 2",
-            "1.00000001*x + 0.99999999*y = 2"
-        ],
-        "variables": ["x", "y"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="large_degree_polynomial",
-    category="complexity",
-    description="High-degree polynomial",
-    tags=["polynomial", "complexity"],
-    expected_behavior={"outcome": "degraded_success", "confidence_min": 0.3}
-)
-def generate_large_degree_polynomial() -> Dict[str, Any]:
-    """Generate high-degree polynomial."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["x^10 - 1 = 0"],
-        "variables": ["x"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="repeated_roots",
-    category="singularity",
-    description="Polynomial with repeated roots",
-    tags=["polynomial", "roots"],
-    expected_behavior={"outcome": "success", "confidence_min": 0.6}
-)
-def generate_repeated_roots() -> Dict[str, Any]:
-    """Generate polynomial with repeated roots."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["(x - 1)^3 = 0"],
-        "variables": ["x"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="complex_roots",
-    category="complexity",
-    description="Polynomial with complex roots",
-    tags=["polynomial", "complex"],
-    expected_behavior={"outcome": "success", "confidence_min": 0.7}
-)
-def generate_complex_roots() -> Dict[str, Any]:
-    """Generate polynomial with complex roots."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["x^2 + 1 = 0"],
-        "variables": ["x"]
-    }
-
-
-@register_edge_case(
-    domain="algebra",
-    case_id="parametric_solution",
-    category="complexity",
-    description="Equation with parametric solution",
-    tags=["system", "parametric"],
-    expected_behavior={"outcome": "success", "confidence_min": 0.5}
+#
+# Specs are read-only module constants with tuple-valued expressions and
+# variables; generators hand out a fresh dict with those rebuilt as lists
+# (see _copy_spec) so callers can still mutate everything they get back.
+
+_OVERFLOW_QUADRATIC = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("x^2 - 1e308*x + 1e307 = 0",),
+    "variables": ("x",)
+})
+
+_UNDERFLOW_QUADRATIC = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("1e-100*x^2 - 1e-100*x + 1e-101 = 0",),
+    "variables": ("x",)
+})
+
+_ILL_CONDITIONED_SYSTEM = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": (
+        "x + y = 2",
+        "1.00000001*x + 0.99999999*y = 2"
+    ),
+    "variables": ("x", "y")
+})
+
+_LARGE_DEGREE_POLYNOMIAL = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("x^10 - 1 = 0",),
+    "variables": ("x",)
+})
+
+_REPEATED_ROOTS = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("(x - 1)^3 = 0",),
+    "variables": ("x",)
+})
+
+_COMPLEX_ROOTS = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("x^2 + 1 = 0",),
+    "variables": ("x",)
+})
+
+_PARAMETRIC_SOLUTION = types.MappingProxyType({
+    "type": "solve",
+    "problem_type": "solve",
+    "domain": "algebra",
+    "expressions": ("x + y = 1",),
+    "variables": ("x", "y")
+})
+
+# (domain, case_id, category, description, tags, expected_behavior, spec)
+_BUILTINS = (
+    (
+        "algebra",
+        "overflow_quadratic",
+        "overflow",
+        "Quadratic equation with coefficients near float64 max",
+        ("quadratic", "numeric_limits"),
+        {"outcome": "degraded_success", "confidence_min": 0.4},
+        _OVERFLOW_QUADRATIC,
+    ),
+    (
+        "algebra",
+        "underflow_quadratic",
+        "underflow",
+        "Quadratic equation with tiny coefficients",
+        ("quadratic", "numeric_limits"),
+        {"outcome": "degraded_success", "confidence_min": 0.4},
+        _UNDERFLOW_QUADRATIC,
+    ),
+    (
+        "algebra",
+        "ill_conditioned_system",
+        "ill_conditioned",
+        "Nearly singular linear system",
+        ("system", "conditioning"),
+        {"outcome": "degraded_success", "confidence_min": 0.5},
+        _ILL_CONDITIONED_SYSTEM,
+    ),
+    (
+        "algebra",
+        "large_degree_polynomial",
+        "complexity",
+        "High-degree polynomial",
+        ("polynomial", "complexity"),
+        {"outcome": "degraded_success", "confidence_min": 0.3},
+        _LARGE_DEGREE_POLYNOMIAL,
+    ),
+    (
+        "algebra",
+        "repeated_roots",
+        "singularity",
+        "Polynomial with repeated roots",
+        ("polynomial", "roots"),
+        {"outcome": "success", "confidence_min": 0.6},
+        _REPEATED_ROOTS,
+    ),
+    (
+        "algebra",
+        "complex_roots",
+        "complexity",
+        "Polynomial with complex roots",
+        ("polynomial", "complex"),
+        {"outcome": "success", "confidence_min": 0.7},
+        _COMPLEX_ROOTS,
+    ),
+    (
+        "algebra",
+        "parametric_solution",
+        "complexity",
+        "Equation with parametric solution",
+        ("system", "parametric"),
+        {"outcome": "success", "confidence_min": 0.5},
+        _PARAMETRIC_SOLUTION,
+    ),
 )
-def generate_parametric_solution() -> Dict[str, Any]:
-    """Generate equation with parametric solution."""
-    return {
-        "type": "solve",
-        "problem_type": "solve",
-        "domain": "algebra",
-        "expressions": ["x + y = 1"],
-        "variables": ["x", "y"]
-    }
+
+
+def _copy_spec(spec: types.MappingProxyType) -> Dict[str, Any]:
+    """Return a mutable copy of a built-in spec with its tuples rebuilt as lists."""
+    return {**spec, "expressions": list(spec["expressions"]), "variables": list(spec["variables"])}
+
+
+def _register_builtins() -> None:
+    """Register the built-in edge cases in one pass over _BUILTINS."""
+    registry = get_edge_case_registry()
+    for domain, case_id, category, description, tags, expected_behavior, spec in _BUILTINS:
+        registry.register(domain, EdgeCase(
+            case_id=case_id,
+            domain=domain,
+            category=category,
+            description=description,
+            generator=functools.partial(_copy_spec, spec),
+            expected_behavior=expected_behavior,
+            tags=frozenset(tags),
+        ))
+
+
+_register_builtins()
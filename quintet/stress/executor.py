@@ -6,12 +6,13 @@ Execute stress tests with budget enforcement, tolerance sweeps,
 and outcome validation.
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from datetime import datetime, timezone
+import functools
 import uuid
 import logging
-import signal
 import time
 
 from quintet.stress.scenario import StressScenario
@@ -21,8 +22,11 @@ from quintet.math.validator import MathValidator
 
 logger = logging.getLogger(__name__)
 
+# Indexed by success * ((meets_confidence_min << 1) | meets_degraded_floor)
+_OUTCOMES = ("failed", "degraded", "success", "success")
 
-@dataclass
+
+@dataclass(slots=True)
 class StressTestResult:
     """Result of a single stress test execution."""
 
@@ -33,17 +37,32 @@ class StressTestResult:
     confidence: float = 0.0
     duration_ms: float = 0.0
     outcome: str = "unknown"  # "success" | "degraded" | "failed" | "timeout"
-    budget_used: Dict[str, Any] = field(default_factory=dict)
-    tolerance_used: Dict[str, float] = field(default_factory=dict)
-    receipts: List[Receipt] = field(default_factory=list)
+    # Containers default to None so timeout/error results skip allocating
+    # empties; to_dict materializes them
+    budget_used: Optional[Dict[str, Any]] = None
+    tolerance_used: Optional[Dict[str, float]] = None
+    receipts: Optional[List[Receipt]] = None
     failure_reason: Optional[str] = None
-    warnings: List[str] = field(default_factory=list)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    warnings: Optional[List[str]] = None
+    # Raw epoch nanoseconds; formatted to ISO only when read via `timestamp`
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> str:
+        """UTC ISO-8601 timestamp of when the result was created."""
+        # Naive UTC, as utcfromtimestamp (deprecated since 3.12) produced
+        utc = datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+        return utc.replace(tzinfo=None).isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result_dict = asdict(self)
-        result_dict["receipts"] = [r.to_dict() if hasattr(r, "to_dict") else r for r in self.receipts]
+        del result_dict["timestamp_ns"]
+        result_dict["timestamp"] = self.timestamp
+        result_dict["budget_used"] = result_dict["budget_used"] or {}
+        result_dict["tolerance_used"] = result_dict["tolerance_used"] or {}
+        result_dict["warnings"] = result_dict["warnings"] or []
+        result_dict["receipts"] = [r.to_dict() for r in self.receipts or ()]
         return result_dict
 
     @property
@@ -57,13 +76,30 @@ class TimeoutException(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=128)
+def _tolerance(absolute: float, relative: float, max_magnitude: float) -> ToleranceConfig:
+    """Return the shared ToleranceConfig for these values.
+
+    Stress runs draw tolerances from a small set, so interning lets runs
+    with identical tolerances share one object; ToleranceConfig is frozen,
+    so no run can change it under another.
+    """
+    return ToleranceConfig(absolute=absolute, relative=relative, max_magnitude=max_magnitude)
+
+
 class StressExecutor:
     """Execute stress tests with budget enforcement and tolerance sweeps."""
 
+    # Shared tolerance for edge cases without a tolerance_config
+    _DEFAULT_TOLERANCE = _tolerance(1e-9, 1e-6, 1e12)
+
     def __init__(self):
         """Initialize executor."""
         self._logger = logger
         self.validator = MathValidator()
+        # RESOURCE_LIMITS entries are updated in place by promotions, so
+        # holding the object reference stays current
+        self._default_limits = RESOURCE_LIMITS["standard"]
 
     def run_stress_test(
         self,
@@ -83,20 +119,27 @@ class StressExecutor:
         Returns:
             StressTestResult with pass/fail and metrics
         """
-        run_id = str(uuid.uuid4())
+        run_id = uuid.uuid4().hex
         case_id = edge_case.get("case_id", "unknown")
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Get resource limits for tier
-            if budget_tier not in RESOURCE_LIMITS:
-                self._logger.warning(f"Unknown budget tier: {budget_tier}, using 'standard'")
+            limits = RESOURCE_LIMITS.get(budget_tier)
+            if limits is None:
+                self._logger.warning("Unknown budget tier: %s, using 'standard'", budget_tier)
                 budget_tier = "standard"
-
-            limits = RESOURCE_LIMITS[budget_tier]
+                limits = self._default_limits
 
             # Get tolerance config
-            tolerance = tolerance_override or self._get_tolerance_for_case(edge_case)
+            if tolerance_override:
+                tolerance = _tolerance(
+                    tolerance_override.absolute,
+                    tolerance_override.relative,
+                    tolerance_override.max_magnitude,
+                )
+            else:
+                tolerance = self._get_tolerance_for_case(edge_case)
 
             # Build problem from edge case
             problem = self._build_problem_from_edge_case(edge_case)
@@ -120,7 +163,7 @@ class StressExecutor:
                 tolerance=tolerance
             )
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
 
             # Build budget tracking
             budget_used = {
@@ -142,14 +185,14 @@ class StressExecutor:
             )
 
             self._logger.info(
-                f"Stress test completed: {scenario.scenario_id}:{case_id} "
-                f"outcome={outcome}, passed={passed}, confidence={confidence:.2f}"
+                "Stress test completed: %s:%s outcome=%s, passed=%s, confidence=%.2f",
+                scenario.scenario_id, case_id, outcome, passed, confidence
             )
 
             return test_result
 
         except TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
 
             return StressTestResult(
                 run_id=run_id,
@@ -164,9 +207,9 @@ class StressExecutor:
             )
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic() - start_time) * 1000
 
-            self._logger.error(f"Error executing stress test {run_id}: {e}", exc_info=True)
+            self._logger.error("Error executing stress test %s: %s", run_id, e, exc_info=True)
 
             return StressTestResult(
                 run_id=run_id,
@@ -179,6 +222,41 @@ class StressExecutor:
                 failure_reason=str(e),
             )
 
+    def run_batch(
+        self,
+        items: Iterable[Tuple[StressScenario, Dict[str, Any]]],
+        budget_tier: str = "standard",
+        max_workers: Optional[int] = None,
+    ) -> List[StressTestResult]:
+        """Execute many stress tests in parallel across worker processes.
+
+        Each worker process builds its own StressExecutor, so CPU-bound
+        solver work is not serialized by the GIL. Workers read
+        RESOURCE_LIMITS as of process start.
+
+        Args:
+            items: (scenario, edge_case) pairs to run
+            budget_tier: Resource budget tier applied to every run
+            max_workers: Worker process count (default: os.cpu_count())
+
+        Returns:
+            StressTestResult list in the same order as items
+        """
+        items = list(items)
+        results: List[Optional[StressTestResult]] = [None] * len(items)
+        if not items:
+            return []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_run_in_worker, scenario, edge_case, budget_tier): index
+                for index, (scenario, edge_case) in enumerate(items)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     def _get_tolerance_for_case(self, edge_case: Dict[str, Any]) -> ToleranceConfig:
         """Get tolerance config for edge case.
 
@@ -188,11 +266,15 @@ class StressExecutor:
         Returns:
             ToleranceConfig
         """
-        tolerance_config = edge_case.get("tolerance_config", {})
-        return ToleranceConfig(
-            absolute=tolerance_config.get("absolute", 1e-9),
-            relative=tolerance_config.get("relative", 1e-6),
-            max_magnitude=tolerance_config.get("max_magnitude", 1e12),
+        tolerance_config = edge_case.get("tolerance_config")
+        if not tolerance_config:
+            return self._DEFAULT_TOLERANCE
+
+        default = self._DEFAULT_TOLERANCE
+        return _tolerance(
+            tolerance_config.get("absolute", default.absolute),
+            tolerance_config.get("relative", default.relative),
+            tolerance_config.get("max_magnitude", default.max_magnitude),
         )
 
     def _build_problem_from_edge_case(self, edge_case: Dict[str, Any]) -> Any:
@@ -228,23 +310,39 @@ class StressExecutor:
         """
         # For now, simulate simple execution
         # In a full implementation, this would integrate with MathExecutor
-        # and respect the timeout
-        timeout_sec = timeout_ms / 1000
-        start = time.time()
+        # and call _check_deadline between solver steps
+        start_ns = time.monotonic_ns()
+        deadline_ns = start_ns + timeout_ms * 1_000_000
 
         # Simulate some work
-        time.sleep(min(0.1, timeout_sec))
+        time.sleep(min(0.1, timeout_ms / 1000))
 
-        if (time.time() - start) > timeout_sec:
-            raise TimeoutException(f"Execution exceeded {timeout_ms}ms timeout")
+        self._check_deadline(deadline_ns, timeout_ms)
 
         return {
             "success": True,
             "confidence": 0.85,
             "result": problem.get("expected_result", {}),
-            "duration_ms": (time.time() - start) * 1000,
+            "duration_ms": (time.monotonic_ns() - start_ns) / 1_000_000,
         }
 
+    @staticmethod
+    def _check_deadline(deadline_ns: int, timeout_ms: int) -> None:
+        """Raise if the monotonic deadline has passed.
+
+        Cooperative alternative to signal-based alarms, which only work on
+        the main thread.
+
+        Args:
+            deadline_ns: Deadline as a time.monotonic_ns() value
+            timeout_ms: Original timeout, for the error message
+
+        Raises:
+            TimeoutException: If the deadline has been exceeded
+        """
+        if time.monotonic_ns() > deadline_ns:
+            raise TimeoutException(f"Execution exceeded {timeout_ms}ms timeout")
+
     def _validate_result(
         self,
         result: Any,
@@ -277,14 +375,31 @@ class StressExecutor:
         # Determine pass/fail
         passed = actual_confidence >= confidence_min
 
-        # Map to outcome string
-        if actual_outcome and actual_confidence >= confidence_min:
-            outcome = "success"
-        elif actual_outcome and actual_confidence >= 0.5:
-            outcome = "degraded"
-            if passed:
-                warnings.append(f"Degraded success: confidence {actual_confidence:.2f} below min {confidence_min:.2f}")
-        else:
-            outcome = "failed"
+        # Map to outcome string: a successful run meeting its minimum is a
+        # success, one only clearing the 0.5 floor is degraded
+        index = bool(actual_outcome) * ((passed << 1) | (actual_confidence >= 0.5))
+        outcome = _OUTCOMES[index]
+        if index == 1:
+            warnings.append(f"Degraded success: confidence {actual_confidence:.2f} below min {confidence_min:.2f}")
 
         return passed, outcome, actual_confidence, warnings
+
+
+# Per-process executor reused by run_batch workers
+_worker_executor: Optional[StressExecutor] = None
+
+
+def _run_in_worker(
+    scenario: StressScenario,
+    edge_case: Dict[str, Any],
+    budget_tier: str,
+) -> StressTestResult:
+    """Run one stress test inside a run_batch worker process."""
+    global _worker_executor
+    if _worker_executor is None:
+        _worker_executor = StressExecutor()
+    return _worker_executor.run_stress_test(
+        scenario=scenario,
+        edge_case=edge_case,
+        budget_tier=budget_tier,
+    )
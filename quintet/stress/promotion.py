@@ -8,18 +8,148 @@ coverage statistics and eligibility criteria.
 Implements the causal loop: stress test -> promotion -> policy update -> validation
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Deque, Dict, Any, Optional, List, Tuple
+from datetime import datetime, timezone
+import itertools
 import logging
-import copy
 import json
+import time
+import types
+import weakref
 
 from quintet.stress.coverage import CoverageTracker
-from quintet.core.types import RESOURCE_LIMITS
+from quintet.core.types import RESOURCE_LIMITS, ResourceLimits
+
+try:
+    import numpy as np
+except ImportError:  # optional, from the "math" extra
+    np = None
+
+try:
+    import numba
+except ImportError:  # optional; confidence scoring runs as plain Python
+    numba = None
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Policy fields captured by snapshots, derived so new ResourceLimits fields
+# are included automatically
+_POLICY_FIELDS = tuple(f.name for f in fields(ResourceLimits))
+_ALLOWED_FIELDS = frozenset(_POLICY_FIELDS)
+
+# Eligibility reason templates, indexed by whether the check passed
+_RUNS_REASONS = (
+    "Insufficient runs: {} < {} required",
+    "✓ Runs threshold met: {} >= {}",
+)
+_FAILURE_RATE_REASONS = (
+    "Failure rate too high: {:.1%} > {:.1%}",
+    "✓ Failure rate acceptable: {:.1%} <= {:.1%}",
+)
+_NO_RUNS_REASON = "Insufficient runs: 0 < {} required (no runs recorded yet)"
+_CONFIDENCE_REASONS = (
+    "Confidence too low: {:.2f} < {:.2f}",
+    "✓ Confidence threshold met: {:.2f} >= {:.2f}",
+)
+
+# Recent actions kept in memory when history is persisted to disk
+AUDIT_TRAIL_BUFFER_MAX_SIZE = 1000
+# Actions buffered before a background append to the history file
+AUDIT_TRAIL_FLUSH_BATCH = 50
+
+
+def _confidence_score_core(
+    total_runs: float,
+    failure_rate: float,
+    avg_confidence: float,
+    min_runs: float,
+    max_failure_rate: float,
+    min_avg_confidence: float
+) -> float:
+    """Promotion confidence score from primitive stats (0.0 to 1.0).
+
+    Kept free of Python objects so it can be JIT-compiled with numba.
+    """
+    # 1. Runs completeness (0-1)
+    runs_complete = min(total_runs / min_runs, 1.0)
+
+    # 2. Failure rate margin (0-1)
+    # How much margin between current and threshold?
+    if failure_rate <= max_failure_rate:
+        failure_margin = min((max_failure_rate - failure_rate) / max_failure_rate * 1.5, 1.0)
+    else:
+        failure_margin = 0.0
+
+    # 3. Confidence margin (0-1)
+    # How much above threshold?
+    if avg_confidence >= min_avg_confidence:
+        confidence_margin = min(
+            (avg_confidence - min_avg_confidence) / (1.0 - min_avg_confidence), 1.0
+        )
+    else:
+        confidence_margin = 0.0
+
+    # Weighted average: 40% runs, 30% failure rate, 30% confidence
+    score = 0.4 * runs_complete + 0.3 * failure_margin + 0.3 * confidence_margin
+    return max(0.0, min(1.0, score))
+
+
+if numba is not None:
+    # Compiled lazily on first call and cached on disk across processes
+    _confidence_score_core = numba.njit(cache=True)(_confidence_score_core)
+
+
+def _clone_snapshot(snapshot: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy a policy snapshot; tier values are immutable scalars."""
+    return {tier: dict(values) for tier, values in snapshot.items()}
+
+
+def _freeze(value: Any) -> Any:
+    """Return value with every nested dict copied into a read-only mapping."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(obj: Any) -> Dict[str, Any]:
+    """JSON default hook: serialize read-only mappings as objects."""
+    if isinstance(obj, types.MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_thaw, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_thaw)
+
+
+def _write_history_entries(path: Path, entries: List[Dict[str, Any]]) -> None:
+    """Synchronously append buffered history entries (manager finalizer).
+
+    Runs once no background flush can still be pending: at exit the
+    writer threads are joined first, and an in-flight flush keeps its
+    manager reachable until it completes.
+    """
+    if not entries:
+        return
+    lines = "".join(_dumps(entry) + "\n" for entry in entries)
+    entries.clear()
+    try:
+        StressPromotionManager._append_history_lines(path, lines)
+    except OSError as e:
+        logger.error(f"Failed to write promotion history to {path}: {e}")
+
 
 @dataclass
 class PromotionDecision:
@@ -44,13 +174,21 @@ class PromotionAction:
     decision: PromotionDecision
     action: str  # "promote" | "constrain" | "observe" | "rollback"
     reason: str
-    executed_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Raw epoch nanoseconds; formatted to ISO only when read via `executed_at`
+    executed_at_ns: int = field(default_factory=time.time_ns)
     result: Optional[Dict[str, Any]] = None  # Details of what changed
 
     # For rollback capability
     old_policy: Optional[Dict[str, Any]] = None
     new_policy: Optional[Dict[str, Any]] = None
 
+    @property
+    def executed_at(self) -> str:
+        """UTC ISO-8601 timestamp of when the action was created."""
+        # Naive UTC, as utcfromtimestamp (deprecated since 3.12) produced
+        utc = datetime.fromtimestamp(self.executed_at_ns / 1e9, tz=timezone.utc)
+        return utc.replace(tzinfo=None).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -69,30 +207,93 @@ class PromotionAction:
         }
 
 
+@dataclass(slots=True)
+class SummaryEntry:
+    """One scenario's line in a promotion readiness summary."""
+    scenario_id: str
+    name: Optional[str]
+    confidence_score: float
+    missing_checks: Optional[List[str]] = None  # Near-eligible scenarios only
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        result = {
+            "scenario_id": self.scenario_id,
+            "name": self.name,
+            "confidence_score": self.confidence_score
+        }
+        if self.missing_checks is not None:
+            result["missing_checks"] = self.missing_checks
+        return result
+
+
 class StressPromotionManager:
     """Manage promotion from shadow (test) to production."""
 
-    def __init__(self, tracker: Optional[CoverageTracker] = None):
+    # Default (min_runs, max_failure_rate, min_avg_confidence)
+    _DEFAULT_THRESHOLDS = (20, 0.15, 0.60)
+
+    # Below this many scenarios, per-scenario scoring beats building arrays
+    _VECTORIZE_MIN_SCENARIOS = 32
+
+    # Scenarios scored per batch while streaming the promotion summary
+    _SUMMARY_CHUNK = 1000
+
+    def __init__(
+        self,
+        tracker: Optional[CoverageTracker] = None,
+        history_path: Optional[str] = None,
+        history_cap: int = AUDIT_TRAIL_BUFFER_MAX_SIZE
+    ):
         """Initialize promotion manager.
 
         Args:
             tracker: Optional CoverageTracker instance (creates new if None)
+            history_path: Optional JSONL file the audit trail is appended to.
+                When set, only the most recent history_cap actions are kept
+                in memory, seeded from the end of an existing file;
+                otherwise the full history is kept in memory.
+            history_cap: In-memory history size when history_path is set
         """
         self.tracker = tracker or CoverageTracker()
         self._logger = logger
 
-        # Audit trail of all promotion actions
-        self._promotion_history: List[PromotionAction] = []
+        # Audit trail of promotion actions
+        # (action, serialized action); actions are never modified once recorded.
+        # Entries loaded from history_path have no PromotionAction.
+        self.history_path = Path(history_path) if history_path else None
+        self._promotion_history: Deque[
+            Tuple[Optional[PromotionAction], Dict[str, Any]]
+        ] = deque(maxlen=history_cap if self.history_path else None)
+        self._pending_history: List[Dict[str, Any]] = []
+        self._history_writer: Optional[ThreadPoolExecutor] = None
+        self._history_flushes: List[Future] = []
+
+        if self.history_path is not None:
+            self._load_history_tail()
+            # Buffered actions are written even if close() is never called,
+            # when the manager is collected or the interpreter exits
+            self._history_finalizer = weakref.finalize(
+                self, _write_history_entries, self.history_path, self._pending_history
+            )
 
         # Policy snapshots for rollback (keyed by scenario_id)
         self._policy_snapshots: Dict[str, Dict[str, Any]] = {}
 
+        # Memoized eligibility decisions:
+        # (scenario_id, thresholds...) -> (stats fingerprint, decision)
+        self._eligibility_cache: Dict[
+            Tuple[Any, ...], Tuple[Tuple[Any, ...], PromotionDecision]
+        ] = {}
+
     def check_promotion_eligibility(
         self,
         scenario_id: str,
         min_runs: Optional[int] = None,
         max_failure_rate: Optional[float] = None,
-        min_avg_confidence: Optional[float] = None
+        min_avg_confidence: Optional[float] = None,
+        stats: Optional[Dict[str, Any]] = None,
+        build_reason: bool = True
     ) -> PromotionDecision:
         """Check if scenario is eligible for promotion.
 
@@ -101,77 +302,199 @@ class StressPromotionManager:
             min_runs: Minimum number of test runs (default: 20)
             max_failure_rate: Maximum acceptable failure rate (default: 0.15)
             min_avg_confidence: Minimum average confidence (default: 0.60)
+            stats: Pre-fetched scenario stats (fetched from the tracker if None)
+            build_reason: Format the human-readable reason; callers that only
+                read eligible/confidence_score/checks_passed can skip it
 
         Returns:
             PromotionDecision with eligibility and reasoning
         """
         # Use defaults
-        min_runs = min_runs or 20
-        max_failure_rate = max_failure_rate or 0.15
-        min_avg_confidence = min_avg_confidence or 0.60
+        default_runs, default_failure_rate, default_confidence = self._DEFAULT_THRESHOLDS
+        min_runs = min_runs or default_runs
+        max_failure_rate = max_failure_rate or default_failure_rate
+        min_avg_confidence = min_avg_confidence or default_confidence
 
         # Get scenario stats
-        stats = self.tracker.get_scenario_stats(scenario_id)
-
-        checks_passed = {}
-        reasons = []
+        if stats is None:
+            stats = self.tracker.get_scenario_stats(scenario_id)
 
-        # Check 1: Minimum runs
-        check1 = stats["total_runs"] >= min_runs
-        checks_passed["min_runs"] = check1
-        if not check1:
-            reasons.append(
-                f"Insufficient runs: {stats['total_runs']} < {min_runs} required"
-            )
-        else:
-            reasons.append(f"✓ Runs threshold met: {stats['total_runs']} >= {min_runs}")
-
-        # Check 2: Failure rate
-        failure_rate = stats["failure_rate"]
-        check2 = failure_rate <= max_failure_rate
-        checks_passed["failure_rate"] = check2
-        if not check2:
-            reasons.append(
-                f"Failure rate too high: {failure_rate:.1%} > {max_failure_rate:.1%}"
-            )
-        else:
-            reasons.append(f"✓ Failure rate acceptable: {failure_rate:.1%} <= {max_failure_rate:.1%}")
-
-        # Check 3: Average confidence
-        avg_conf = stats["avg_confidence"]
-        check3 = avg_conf >= min_avg_confidence
-        checks_passed["avg_confidence"] = check3
-        if not check3:
-            reasons.append(
-                f"Confidence too low: {avg_conf:.2f} < {min_avg_confidence:.2f}"
-            )
-        else:
-            reasons.append(f"✓ Confidence threshold met: {avg_conf:.2f} >= {min_avg_confidence:.2f}")
-
-        # Overall eligibility
-        eligible = check1 and check2 and check3
+        cached = self._cached_decision(
+            scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence, build_reason
+        ) or self._no_runs_decision(
+            scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence, build_reason
+        )
+        if cached is not None:
+            return cached
 
         # Compute confidence score (0-1) for promotion likelihood
         confidence_score = self._compute_confidence_score(
             stats, min_runs, max_failure_rate, min_avg_confidence
         )
 
+        return self._build_decision(
+            scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence,
+            confidence_score, build_reason
+        )
+
+    def _no_runs_decision(
+        self,
+        scenario_id: str,
+        stats: Dict[str, Any],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float,
+        build_reason: bool = True
+    ) -> Optional[PromotionDecision]:
+        """Return the decision for a scenario with no recorded runs.
+
+        Unrun scenarios fail every check and score 0.0, so the full
+        evaluation can be skipped. Only applies when the stats actually
+        fail all three thresholds, which the tracker's zero-run stats
+        (failure_rate 1.0, avg_confidence 0.0) do.
+
+        Returns:
+            PromotionDecision, or None if the full evaluation is needed
+        """
+        if (
+            stats["total_runs"]
+            or stats["failure_rate"] <= max_failure_rate
+            or stats["avg_confidence"] >= min_avg_confidence
+        ):
+            return None
+
+        decision = PromotionDecision(
+            scenario_id=scenario_id,
+            eligible=False,
+            reason=_NO_RUNS_REASON.format(min_runs) if build_reason else "",
+            stats=stats,
+            confidence_score=0.0,
+            checks_passed={"min_runs": False, "failure_rate": False, "avg_confidence": False}
+        )
+        self._store_decision(
+            scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence, decision
+        )
+        return decision
+
+    def _cached_decision(
+        self,
+        scenario_id: str,
+        stats: Dict[str, Any],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float,
+        build_reason: bool = True
+    ) -> Optional[PromotionDecision]:
+        """Return the memoized decision if the scenario stats are unchanged.
+
+        Keyed on the stats themselves rather than a write counter, since
+        other trackers or processes may write to the same database. A
+        decision cached without a reason does not satisfy build_reason.
+
+        Returns:
+            Cached PromotionDecision, or None on a miss
+        """
+        cached = self._eligibility_cache.get(
+            (scenario_id, min_runs, max_failure_rate, min_avg_confidence)
+        )
+        if cached is not None and cached[0] == (
+            stats["total_runs"], stats["passed_runs"], stats["avg_confidence"]
+        ) and (cached[1].reason or not build_reason):
+            return cached[1]
+        return None
+
+    def _build_decision(
+        self,
+        scenario_id: str,
+        stats: Dict[str, Any],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float,
+        confidence_score: float,
+        build_reason: bool = True
+    ) -> PromotionDecision:
+        """Evaluate eligibility checks and memoize the resulting decision.
+
+        Args:
+            scenario_id: Scenario identifier
+            stats: Scenario statistics
+            min_runs: Minimum runs threshold
+            max_failure_rate: Maximum failure rate threshold
+            min_avg_confidence: Minimum confidence threshold
+            confidence_score: Precomputed promotion confidence score
+            build_reason: Format the human-readable reason (empty if False)
+
+        Returns:
+            PromotionDecision with eligibility and reasoning
+        """
+        checks_passed = {
+            "min_runs": stats["total_runs"] >= min_runs,
+            "failure_rate": stats["failure_rate"] <= max_failure_rate,
+            "avg_confidence": stats["avg_confidence"] >= min_avg_confidence,
+        }
+
+        # Overall eligibility
+        eligible = all(checks_passed.values())
+
         decision = PromotionDecision(
             scenario_id=scenario_id,
             eligible=eligible,
-            reason="\n".join(reasons),
+            reason=self._format_reason(
+                stats, checks_passed, min_runs, max_failure_rate, min_avg_confidence
+            ) if build_reason else "",
             stats=stats,
             confidence_score=confidence_score,
             checks_passed=checks_passed
         )
 
-        self._logger.info(
-            f"Promotion eligibility check: {scenario_id} - eligible={eligible}, "
-            f"confidence={confidence_score:.2f}"
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                f"Promotion eligibility check: {scenario_id} - eligible={eligible}, "
+                f"confidence={confidence_score:.2f}"
+            )
 
+        self._store_decision(
+            scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence, decision
+        )
         return decision
 
+    def _store_decision(
+        self,
+        scenario_id: str,
+        stats: Dict[str, Any],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float,
+        decision: PromotionDecision
+    ) -> None:
+        """Memoize a decision against the stats it was computed from."""
+        self._eligibility_cache[(scenario_id, min_runs, max_failure_rate, min_avg_confidence)] = (
+            (stats["total_runs"], stats["passed_runs"], stats["avg_confidence"]),
+            decision,
+        )
+
+    @staticmethod
+    def _format_reason(
+        stats: Dict[str, Any],
+        checks_passed: Dict[str, bool],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float
+    ) -> str:
+        """Format the per-check explanation for a promotion decision."""
+        return "\n".join((
+            # Check 1: Minimum runs
+            _RUNS_REASONS[checks_passed["min_runs"]].format(stats["total_runs"], min_runs),
+            # Check 2: Failure rate
+            _FAILURE_RATE_REASONS[checks_passed["failure_rate"]].format(
+                stats["failure_rate"], max_failure_rate
+            ),
+            # Check 3: Average confidence
+            _CONFIDENCE_REASONS[checks_passed["avg_confidence"]].format(
+                stats["avg_confidence"], min_avg_confidence
+            ),
+        ))
+
     def _compute_confidence_score(
         self,
         stats: Dict[str, Any],
@@ -190,80 +513,129 @@ class StressPromotionManager:
         Returns:
             Confidence score from 0.0 to 1.0
         """
-        components = []
-
-        # 1. Runs completeness (0-1)
-        runs_complete = min(stats["total_runs"] / min_runs, 1.0)
-        components.append(runs_complete)
-
-        # 2. Failure rate margin (0-1)
-        # How much margin between current and threshold?
-        current_fr = stats["failure_rate"]
-        if current_fr <= max_failure_rate:
-            margin = (max_failure_rate - current_fr) / max_failure_rate
-            components.append(min(margin * 1.5, 1.0))  # Scale up margin bonus
-        else:
-            components.append(0.0)
-
-        # 3. Confidence margin (0-1)
-        # How much above threshold?
-        current_conf = stats["avg_confidence"]
-        if current_conf >= min_avg_confidence:
-            margin = (current_conf - min_avg_confidence) / (1.0 - min_avg_confidence)
-            components.append(min(margin, 1.0))
-        else:
-            components.append(0.0)
+        return _confidence_score_core(
+            stats["total_runs"], stats["failure_rate"], stats["avg_confidence"],
+            min_runs, max_failure_rate, min_avg_confidence
+        )
 
-        # Weighted average: 40% runs, 30% failure rate, 30% confidence
-        score = (
-            0.4 * components[0] +
-            0.3 * components[1] +
-            0.3 * components[2]
+    def _compute_confidence_scores(
+        self,
+        stats_list: List[Dict[str, Any]],
+        min_runs: int,
+        max_failure_rate: float,
+        min_avg_confidence: float
+    ) -> List[float]:
+        """Compute confidence scores for many scenarios at once.
+
+        Uses NumPy when it is installed and the batch is large enough to
+        amortize array construction; otherwise falls back to
+        _compute_confidence_score per scenario. Both paths give identical
+        results.
+
+        Args:
+            stats_list: Scenario statistics, one dict per scenario
+            min_runs: Minimum runs threshold
+            max_failure_rate: Maximum failure rate threshold
+            min_avg_confidence: Minimum confidence threshold
+
+        Returns:
+            Confidence scores from 0.0 to 1.0, in input order
+        """
+        if np is None or len(stats_list) < self._VECTORIZE_MIN_SCENARIOS:
+            return [
+                self._compute_confidence_score(
+                    stats, min_runs, max_failure_rate, min_avg_confidence
+                )
+                for stats in stats_list
+            ]
+
+        total_runs = np.fromiter(
+            (s["total_runs"] for s in stats_list), dtype=np.float64, count=len(stats_list)
+        )
+        failure_rate = np.fromiter(
+            (s["failure_rate"] for s in stats_list), dtype=np.float64, count=len(stats_list)
+        )
+        avg_confidence = np.fromiter(
+            (s["avg_confidence"] for s in stats_list), dtype=np.float64, count=len(stats_list)
+        )
+
+        runs_complete = np.minimum(total_runs / min_runs, 1.0)
+        fr_margin = np.clip((max_failure_rate - failure_rate) / max_failure_rate * 1.5, 0.0, 1.0)
+        conf_margin = np.clip(
+            (avg_confidence - min_avg_confidence) / (1.0 - min_avg_confidence), 0.0, 1.0
         )
 
-        return max(0.0, min(1.0, score))
+        # Weighted average: 40% runs, 30% failure rate, 30% confidence
+        scores = 0.4 * runs_complete + 0.3 * fr_margin + 0.3 * conf_margin
+        return np.clip(scores, 0.0, 1.0).tolist()
 
     def get_promotion_summary(self) -> Dict[str, Any]:
         """Get summary of promotion readiness across all scenarios.
 
         Returns:
-            Dictionary with promotion readiness by status
+            Dictionary with promotion readiness by status; each bucket is a
+            list of SummaryEntry (use SummaryEntry.to_dict for JSON output)
         """
-        report = self.tracker.generate_coverage_report()
-
         eligible_scenarios = []
         near_eligible_scenarios = []
         not_eligible_scenarios = []
 
-        for scenario in report.get("scenarios", []):
-            decision = self.check_promotion_eligibility(scenario["scenario_id"])
-
-            if decision.eligible:
-                eligible_scenarios.append({
-                    "scenario_id": scenario["scenario_id"],
-                    "name": scenario.get("name"),
-                    "confidence_score": decision.confidence_score
-                })
-            elif decision.confidence_score >= 0.5:
-                near_eligible_scenarios.append({
-                    "scenario_id": scenario["scenario_id"],
-                    "name": scenario.get("name"),
-                    "confidence_score": decision.confidence_score,
-                    "missing_checks": [k for k, v in decision.checks_passed.items() if not v]
-                })
-            else:
-                not_eligible_scenarios.append({
-                    "scenario_id": scenario["scenario_id"],
-                    "name": scenario.get("name"),
-                    "confidence_score": decision.confidence_score
-                })
+        add_eligible = eligible_scenarios.append
+        add_near_eligible = near_eligible_scenarios.append
+        add_not_eligible = not_eligible_scenarios.append
+
+        min_runs, max_failure_rate, min_avg_confidence = self._DEFAULT_THRESHOLDS
+        scenarios = self.tracker.iter_scenarios_for_promotion()
+        total_scenarios = 0
+
+        # Stream scenarios in chunks so scoring stays batched without
+        # materializing the full coverage report
+        while True:
+            chunk = list(itertools.islice(scenarios, self._SUMMARY_CHUNK))
+            if not chunk:
+                break
+            total_scenarios += len(chunk)
+
+            # Settle memoized and unrun scenarios, then score the rest in one batch
+            decisions: List[Optional[PromotionDecision]] = [
+                self._cached_decision(
+                    scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence,
+                    build_reason=False
+                ) or self._no_runs_decision(
+                    scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence,
+                    build_reason=False
+                )
+                for scenario_id, _, stats in chunk
+            ]
+            misses = [i for i, decision in enumerate(decisions) if decision is None]
+            scores = self._compute_confidence_scores(
+                [chunk[i][2] for i in misses], min_runs, max_failure_rate, min_avg_confidence
+            )
+            for i, score in zip(misses, scores):
+                scenario_id, _, stats = chunk[i]
+                decisions[i] = self._build_decision(
+                    scenario_id, stats, min_runs, max_failure_rate, min_avg_confidence, score,
+                    build_reason=False
+                )
+
+            for (scenario_id, name, _), decision in zip(chunk, decisions):
+                entry = SummaryEntry(scenario_id, name, decision.confidence_score)
+                if decision.eligible:
+                    add_eligible(entry)
+                elif entry.confidence_score >= 0.5:
+                    entry.missing_checks = [
+                        k for k, v in decision.checks_passed.items() if not v
+                    ]
+                    add_near_eligible(entry)
+                else:
+                    add_not_eligible(entry)
 
         return {
             "ready_for_promotion": eligible_scenarios,
             "near_promotion_ready": near_eligible_scenarios,
             "not_ready": not_eligible_scenarios,
-            "total_scenarios": len(report.get("scenarios", [])),
-            "promotion_ready_pct": len(eligible_scenarios) / max(len(report.get("scenarios", [])), 1)
+            "total_scenarios": total_scenarios,
+            "promotion_ready_pct": len(eligible_scenarios) / max(total_scenarios, 1)
         }
 
     def execute_promotion(
@@ -283,24 +655,24 @@ class StressPromotionManager:
 
         Returns:
             PromotionAction with execution details
+
+        Raises:
+            ValueError: If policy_changes names unknown tiers or fields;
+                nothing is applied or recorded in that case
         """
+        self._validate_policy_changes(policy_changes)
+
         # Save snapshot before making changes
         old_policy = self._snapshot_current_policy()
-        self._policy_snapshots[scenario_id] = old_policy
+        # Private copy so edits to the returned action cannot alter rollback
+        self._policy_snapshots[scenario_id] = _clone_snapshot(old_policy)
+        self._eligibility_cache.clear()
 
         # Apply policy changes
         try:
             for tier, changes in policy_changes.items():
-                if tier not in RESOURCE_LIMITS:
-                    self._logger.warning(f"Unknown tier '{tier}' in policy_changes")
-                    continue
-
                 limits = RESOURCE_LIMITS[tier]
                 for field, new_value in changes.items():
-                    if not hasattr(limits, field):
-                        self._logger.warning(f"Unknown field '{field}' for tier '{tier}'")
-                        continue
-
                     old_value = getattr(limits, field)
                     setattr(limits, field, new_value)
                     self._logger.info(
@@ -320,7 +692,7 @@ class StressPromotionManager:
                 new_policy=new_policy
             )
 
-            self._promotion_history.append(action)
+            self._record_action(action)
             self._logger.info(f"Successfully promoted {scenario_id}")
 
             return action
@@ -339,9 +711,28 @@ class StressPromotionManager:
                 old_policy=old_policy,
                 new_policy=old_policy
             )
-            self._promotion_history.append(action)
+            self._record_action(action)
             raise
 
+    @staticmethod
+    def _validate_policy_changes(policy_changes: Dict[str, Any]) -> None:
+        """Check every tier and field in policy_changes before applying any.
+
+        Raises:
+            ValueError: Listing all unknown tiers and tier.field names
+        """
+        invalid = []
+        for tier, changes in policy_changes.items():
+            if tier not in RESOURCE_LIMITS:
+                invalid.append(tier)
+            else:
+                invalid.extend(
+                    f"{tier}.{field}" for field in changes if field not in _ALLOWED_FIELDS
+                )
+
+        if invalid:
+            raise ValueError(f"Unknown policy_changes keys: {', '.join(invalid)}")
+
     def rollback_promotion(
         self,
         scenario_id: str,
@@ -360,11 +751,12 @@ class StressPromotionManager:
         if scenario_id not in self._policy_snapshots:
             raise ValueError(f"No policy snapshot found for {scenario_id}")
 
-        old_policy = self._policy_snapshots[scenario_id]
+        old_policy = _clone_snapshot(self._policy_snapshots[scenario_id])
         current_policy = self._snapshot_current_policy()
 
         # Restore the old policy
         self._restore_policy(old_policy)
+        self._eligibility_cache.clear()
 
         # Create a dummy decision for rollback
         decision = PromotionDecision(
@@ -384,7 +776,7 @@ class StressPromotionManager:
             new_policy=old_policy
         )
 
-        self._promotion_history.append(action)
+        self._record_action(action)
         self._logger.info(f"Rolled back {scenario_id}: {reason}")
 
         return action
@@ -437,22 +829,123 @@ class StressPromotionManager:
         return regression_scenario
 
     def get_promotion_history(self) -> List[Dict[str, Any]]:
-        """Get audit trail of all promotion actions."""
-        return [action.to_dict() for action in self._promotion_history]
+        """Get audit trail of promotion actions.
+
+        With a history_path, this is the window of the most recent actions,
+        including those loaded from the file when the manager was created;
+        the complete trail is in the history file. Each entry is a fresh
+        dict; nested values (decision, policies, result) are read-only
+        mappings.
+        """
+        return [dict(entry) for _, entry in self._promotion_history]
+
+    def dump_history_json(self) -> str:
+        """Serialize the promotion audit trail to a JSON array string."""
+        return _dumps([entry for _, entry in self._promotion_history])
+
+    def dump_snapshot_json(self) -> str:
+        """Serialize the current RESOURCE_LIMITS policy to a JSON object string."""
+        return _dumps(self._snapshot_current_policy())
+
+    def flush_history(self) -> None:
+        """Write buffered actions to history_path and wait for pending writes."""
+        if self.history_path is None:
+            return
+
+        self._submit_history_flush()
+        for flush in self._history_flushes:
+            flush.result()
+        self._history_flushes.clear()
+
+    def close(self) -> None:
+        """Flush persisted history and stop the background writer."""
+        self.flush_history()
+        if self._history_writer is not None:
+            self._history_writer.shutdown(wait=True)
+            self._history_writer = None
+
+    def _record_action(self, action: PromotionAction) -> None:
+        """Append an action to the history, serializing it once.
+
+        Nested values are frozen into read-only copies, so entries can be
+        handed out as shallow copies without exposing the audit record.
+        """
+        entry = {key: _freeze(value) for key, value in action.to_dict().items()}
+        self._promotion_history.append((action, entry))
+
+        if self.history_path is not None:
+            self._pending_history.append(entry)
+            if len(self._pending_history) >= AUDIT_TRAIL_FLUSH_BATCH:
+                self._submit_history_flush()
+
+    def _submit_history_flush(self) -> None:
+        """Hand buffered history entries to the background writer."""
+        if not self._pending_history:
+            return
+
+        lines = "".join(_dumps(entry) + "\n" for entry in self._pending_history)
+        # Cleared in place; the exit finalizer holds this same list
+        self._pending_history.clear()
+
+        if self._history_writer is None:
+            self._history_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="promotion-history"
+            )
+        # Single worker keeps appends in submission order
+        self._history_flushes = [f for f in self._history_flushes if not f.done()]
+        flush = self._history_writer.submit(self._append_history_lines, self.history_path, lines)
+        flush.add_done_callback(self._log_flush_error)
+        self._history_flushes.append(flush)
+
+    def _log_flush_error(self, flush: Future) -> None:
+        """Report a failed background history write."""
+        error = flush.exception()
+        if error is not None:
+            self._logger.error(f"Failed to write promotion history to {self.history_path}: {error}")
+
+    @staticmethod
+    def _append_history_lines(path: Path, lines: str) -> None:
+        """Append serialized history lines to the JSONL file."""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _load_history_tail(self) -> None:
+        """Seed the in-memory window from the end of an existing history file.
+
+        Lines that do not parse, such as a final line cut short when a
+        process died mid-write, are logged and skipped. An unterminated
+        final line is closed off so the next append starts on a new line.
+        """
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                tail = deque(f, maxlen=self._promotion_history.maxlen)
+        except FileNotFoundError:
+            return
+
+        for line in tail:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                self._logger.warning(f"Skipping unreadable line in {self.history_path}: {e}")
+                continue
+            self._promotion_history.append(
+                (None, {key: _freeze(value) for key, value in entry.items()})
+            )
+
+        if tail and not tail[-1].endswith("\n"):
+            try:
+                self._append_history_lines(self.history_path, "\n")
+            except OSError as e:
+                self._logger.error(f"Failed to write promotion history to {self.history_path}: {e}")
 
     def _snapshot_current_policy(self) -> Dict[str, Any]:
         """Snapshot current RESOURCE_LIMITS for rollback."""
-        snapshot = {}
-        for tier, limits in RESOURCE_LIMITS.items():
-            snapshot[tier] = {
-                "max_wall_time_ms": limits.max_wall_time_ms,
-                "max_plans": limits.max_plans,
-                "max_solutions_per_plan": limits.max_solutions_per_plan,
-                "max_verification_paths": limits.max_verification_paths,
-                "max_memory_mb": limits.max_memory_mb,
-                "max_shell_runtime_ms": limits.max_shell_runtime_ms
-            }
-        return snapshot
+        return {
+            tier: {name: getattr(limits, name) for name in _POLICY_FIELDS}
+            for tier, limits in RESOURCE_LIMITS.items()
+        }
 
     def _restore_policy(self, snapshot: Dict[str, Any]) -> None:
         """Restore RESOURCE_LIMITS from a snapshot."""
@@ -462,5 +955,5 @@ class StressPromotionManager:
 
             limits = RESOURCE_LIMITS[tier]
             for field, value in values.items():
-                if hasattr(limits, field):
+                if field in _ALLOWED_FIELDS:
                     setattr(limits, field, value)
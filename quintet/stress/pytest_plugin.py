@@ -8,8 +8,10 @@ from YAML files.
 
 import pytest
 from pathlib import Path
-from typing import Generator, List, Optional, Any
+from typing import Dict, Generator, List, Optional, Any, Set
+import functools
 import logging
+import re
 
 from quintet.stress.scenario import StressScenario
 from quintet.stress.executor import StressExecutor, StressTestResult
@@ -17,6 +19,30 @@ from quintet.stress.coverage import CoverageTracker
 
 logger = logging.getLogger(__name__)
 
+_SCENARIO_SUFFIXES = frozenset({".yaml", ".yml"})
+_SCENARIO_DIR_RE = re.compile(r"stress/scenarios?")
+
+# Whether a directory is a stress scenario directory, keyed by directory
+_SCENARIO_DIR_CACHE: Dict[Path, bool] = {}
+
+# Scenario IDs already registered with the tracker this session
+_recorded_scenarios: Set[str] = set()
+
+# Run results buffered until pytest_sessionfinish writes them in one batch
+_PENDING_RUNS: List[Dict[str, Any]] = []
+
+
+@functools.lru_cache(maxsize=1)
+def _executor() -> StressExecutor:
+    """Session-wide executor, created on first use."""
+    return StressExecutor()
+
+
+@functools.lru_cache(maxsize=1)
+def _tracker() -> CoverageTracker:
+    """Session-wide coverage tracker, created on first use."""
+    return CoverageTracker()
+
 
 def pytest_addoption(parser: Any) -> None:
     """Add pytest command-line options."""
@@ -65,11 +91,19 @@ def pytest_collect_file(
         StressScenarioFile if file is a stress scenario, None otherwise
     """
     # Only collect YAML files in stress/scenarios directories
-    if file_path.suffix == ".yaml":
-        # Check if it's in a scenarios directory
-        if "stress/scenarios" in str(file_path) or "stress/scenario" in str(file_path):
-            return StressScenarioFile.from_parent(parent, path=file_path)
+    if file_path.suffix not in _SCENARIO_SUFFIXES:
+        return None
+
+    # Check if it's in a scenarios directory (once per directory)
+    directory = file_path.parent
+    is_scenario_dir = _SCENARIO_DIR_CACHE.get(directory)
+    if is_scenario_dir is None:
+        is_scenario_dir = _SCENARIO_DIR_CACHE[directory] = bool(
+            _SCENARIO_DIR_RE.search(directory.as_posix())
+        )
 
+    if is_scenario_dir:
+        return StressScenarioFile.from_parent(parent, path=file_path)
     return None
 
 
@@ -83,17 +117,25 @@ class StressScenarioFile(pytest.File):
             StressScenarioTest items for each edge case
         """
         try:
+            # Only edge_cases scenarios run under --stress-skip-slow, so check
+            # the category before parsing the edge cases themselves
+            if self.config.getoption("--stress-skip-slow"):
+                metadata = StressScenario.from_yaml_metadata_only(str(self.path))
+                if metadata.category != "edge_cases":
+                    pytest.skip(f"Skipping slow stress scenario: {metadata.scenario_id}")
+
             # Load scenario from YAML
             scenario = StressScenario.from_yaml(str(self.path))
 
             # Create a test item for each edge case
+            scenario_id = scenario.scenario_id
+            make_item = StressScenarioTest.from_parent
             for edge_case in scenario.edge_cases:
                 case_id = edge_case.get("case_id", "unknown")
-                test_name = f"{scenario.scenario_id}::{case_id}"
 
-                yield StressScenarioTest.from_parent(
+                yield make_item(
                     self,
-                    name=test_name,
+                    name=f"{scenario_id}::{case_id}",
                     scenario=scenario,
                     edge_case=edge_case
                 )
@@ -159,22 +201,23 @@ class StressScenarioTest(pytest.Item):
             pytest.skip(f"Skipping slow stress test: {self.scenario.scenario_id}")
 
         # Execute stress test
-        executor = StressExecutor()
-        result = executor.run_stress_test(
+        result = _executor().run_stress_test(
             scenario=self.scenario,
             edge_case=self.edge_case,
             budget_tier=budget_tier
         )
 
         # Record to coverage tracker
-        tracker = CoverageTracker()
-        tracker.record_scenario(
-            scenario_id=self.scenario.scenario_id,
-            name=self.scenario.name,
-            category=self.scenario.category,
-            domain=self.scenario.domain
-        )
-        tracker.record_run(result.to_dict())
+        tracker = _tracker()
+        if self.scenario.scenario_id not in _recorded_scenarios:
+            tracker.record_scenario(
+                scenario_id=self.scenario.scenario_id,
+                name=self.scenario.name,
+                category=self.scenario.category,
+                domain=self.scenario.domain
+            )
+            _recorded_scenarios.add(self.scenario.scenario_id)
+        _PENDING_RUNS.append(result.to_dict())
 
         # Assert test passed
         assert result.passed, (
@@ -202,29 +245,41 @@ class StressScenarioTest(pytest.Item):
 
 
 def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
-    """Generate coverage report after test session.
+    """Flush buffered runs and generate coverage report after test session.
 
     Args:
         session: Pytest session
         exitstatus: Exit status code
     """
+    # Persist buffered runs before any reporting reads them
+    if _PENDING_RUNS:
+        _tracker().record_runs_bulk(_PENDING_RUNS)
+        _PENDING_RUNS.clear()
+
     # Check if coverage report was requested
     if session.config.getoption("--stress-coverage-report"):
-        tracker = CoverageTracker()
+        tracker = _tracker()
 
         # Generate and print report
         report = tracker.generate_coverage_report()
 
-        logger.info("\n" + "=" * 80)
-        logger.info("STRESS TEST COVERAGE REPORT")
-        logger.info("=" * 80)
-        logger.info(f"Total scenarios: {report['total_scenarios']}")
-        logger.info(f"Total runs: {report['total_runs']}")
-        logger.info(f"Overall failure rate: {report['overall_failure_rate']:.1%}")
-        logger.info(f"Average confidence: {report['avg_confidence']:.2f}")
-        logger.info(f"\nGaps: {report['gap_summary']['total_gaps']}")
-        logger.info(f"High priority gaps: {report['gap_summary']['high_priority_gaps']}")
-        logger.info("=" * 80 + "\n")
+        # One record, so handlers emit the report as a single block
+        gap_summary = report["gap_summary"]
+        logger.info("\n".join((
+            "",
+            "=" * 80,
+            "STRESS TEST COVERAGE REPORT",
+            "=" * 80,
+            f"Total scenarios: {report['total_scenarios']}",
+            f"Total runs: {report['total_runs']}",
+            f"Overall failure rate: {report['overall_failure_rate']:.1%}",
+            f"Average confidence: {report['avg_confidence']:.2f}",
+            "",
+            f"Gaps: {gap_summary['total_gaps']}",
+            f"High priority gaps: {gap_summary['high_priority_gaps']}",
+            "=" * 80,
+            "",
+        )))
 
         # Save report to file
         report_path = "stress_coverage_report.json"
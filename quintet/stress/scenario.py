@@ -6,17 +6,43 @@ YAML-based scenario definitions for systematic edge case testing,
 budget sweeps, and tolerance analysis.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import copy
 import yaml
 import json
 import logging
 
+try:
+    # libyaml-backed loader; same safe semantics as yaml.safe_load
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parsed scenario YAML keyed by resolved path -> (st_mtime_ns, st_size, data)
+_SCENARIO_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Top-level scalar fields read by StressScenario.from_yaml_metadata_only
+_METADATA_FIELDS = ("scenario_id", "name", "description", "category", "domain")
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj to 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
 
-@dataclass
+@dataclass(slots=True)
 class StressScenario:
     """Declarative stress testing scenario."""
 
@@ -31,12 +57,25 @@ class StressScenario:
     promotion_config: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization.
+
+        Nested containers are shared with the scenario, not copied.
+        """
+        return {
+            "scenario_id": self.scenario_id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "domain": self.domain,
+            "tags": self.tags,
+            "stress_config": self.stress_config,
+            "edge_cases": self.edge_cases,
+            "promotion_config": self.promotion_config,
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return _dumps_indented(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StressScenario":
@@ -47,6 +86,9 @@ class StressScenario:
     def from_yaml(cls, path: str) -> "StressScenario":
         """Load scenario from YAML file.
 
+        Parsed files are cached by modification time and size, so unchanged
+        files are not re-parsed. Each call returns an independent instance.
+
         Args:
             path: Path to YAML scenario file
 
@@ -54,15 +96,24 @@ class StressScenario:
             StressScenario instance
         """
         yaml_path = Path(path)
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"Scenario file not found: {yaml_path}")
+        try:
+            stat = yaml_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Scenario file not found: {yaml_path}") from None
+
+        cache_key = str(yaml_path.resolve())
+        cached = _SCENARIO_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cls.from_dict(copy.deepcopy(cached[2]))
 
         try:
             with open(yaml_path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_SafeLoader)
 
             logger.info(f"Loaded stress scenario from {yaml_path}: {data.get('scenario_id')}")
-            return cls.from_dict(data)
+            scenario = cls.from_dict(data)
+            _SCENARIO_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
+            return scenario
 
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file {yaml_path}: {e}")
@@ -71,6 +122,50 @@ class StressScenario:
             logger.error(f"Error loading scenario from {yaml_path}: {e}")
             raise
 
+    @classmethod
+    def from_yaml_metadata_only(cls, path: str) -> "StressScenario":
+        """Load only a scenario's top-level identifying fields from YAML.
+
+        Walks the parser event stream instead of composing the document, so
+        nested values such as edge_cases and stress_config are skipped without
+        being built and are left at their defaults. Parsing stops as soon as
+        every identifying field has been seen. Values are the raw scalar
+        strings; fields absent from the file are empty strings.
+
+        Args:
+            path: Path to YAML scenario file
+
+        Returns:
+            StressScenario with only scenario_id, name, description, category
+            and domain populated
+        """
+        metadata = dict.fromkeys(_METADATA_FIELDS, "")
+        remaining = set(_METADATA_FIELDS)
+        depth = 0
+        key = None
+
+        with open(path) as f:
+            for event in yaml.parse(f, Loader=_SafeLoader):
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                    if depth == 2:
+                        # Container value of a top-level key
+                        key = None
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+                elif depth == 1:
+                    if key is None:
+                        key = getattr(event, "value", None)
+                        continue
+                    if key in remaining and isinstance(event, yaml.ScalarEvent):
+                        metadata[key] = event.value
+                        remaining.discard(key)
+                        if not remaining:
+                            break
+                    key = None
+
+        return cls(**metadata)
+
     def get_edge_cases(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get edge cases, optionally filtered by category.
 
@@ -8,22 +8,41 @@ Exposes:
   - Phase 2: Live system integration (Loom ↔ Quintet)
 """
 
+import importlib
+
 from quintet.validation.types import ValidationCheckResult, ValidationSummary
-from quintet.validation.phase1 import (
-    run_phase1_validation,
-    summarize_phase1,
-    check_episode_quality,
-    check_recommendations,
-    check_stress_gates,
-    check_receipt_chain,
-)
-from quintet.validation.phase2 import (
-    run_phase2_validation,
-    summarize_phase2,
-    check_live_path,
-    check_policy_effect,
-    check_failure_mode,
-)
+
+# Phase modules pull in the causal/receipt stack and loom_adapter, so they are
+# imported on first attribute access (PEP 562) rather than with the package
+_LAZY = {
+    # Phase 1
+    "run_phase1_validation": "quintet.validation.phase1",
+    "summarize_phase1": "quintet.validation.phase1",
+    "check_episode_quality": "quintet.validation.phase1",
+    "check_recommendations": "quintet.validation.phase1",
+    "check_stress_gates": "quintet.validation.phase1",
+    "check_receipt_chain": "quintet.validation.phase1",
+    # Phase 2
+    "run_phase2_validation": "quintet.validation.phase2",
+    "summarize_phase2": "quintet.validation.phase2",
+    "check_live_path": "quintet.validation.phase2",
+    "check_policy_effect": "quintet.validation.phase2",
+    "check_failure_mode": "quintet.validation.phase2",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Types
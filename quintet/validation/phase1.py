@@ -12,11 +12,14 @@ All checks return ValidationCheckResult; the CLI interprets them.
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from quintet.validation.types import ValidationCheckResult, ValidationSummary
 from quintet.causal.policy_receipts import (
@@ -36,6 +39,15 @@ from quintet.loom_adapter import LoomEpisode, analyze_episodes
 # ---------- Helpers ----------
 
 
+# Fields every exported episode must carry
+_REQUIRED_EPISODE_FIELDS = frozenset(("mode", "outcome"))
+
+# Stress gate CLI ships with the package, so its location and presence are
+# fixed for the life of the process
+_STRESS_SCRIPT_PATH = Path(__file__).resolve().parents[1] / "stress" / "run_pre_promote.py"
+_STRESS_SCRIPT_EXISTS = _STRESS_SCRIPT_PATH.exists()
+
+
 def _require_keys(obj: Dict[str, Any], keys: List[str]) -> List[str]:
     """Return list of missing keys in obj."""
     return [k for k in keys if k not in obj]
@@ -46,10 +58,102 @@ def _dict_to_loom_episode(ep_dict: Dict[str, Any]) -> LoomEpisode:
     return LoomEpisode.from_dict(ep_dict)
 
 
+# (LoomEpisode or None per input episode, failed episode ids, matching error messages)
+ConvertedEpisodes = Tuple[List[Optional[LoomEpisode]], List[str], List[str]]
+
+
+def _convert_episodes(episodes: List[Dict[str, Any]]) -> ConvertedEpisodes:
+    """
+    Convert every episode dict once, collecting parse errors.
+
+    The converted list is index-aligned with episodes, with None where
+    parsing failed, so one pass can serve all Phase 1 checks. Parse
+    failures are kept as parallel id and message lists.
+    """
+    converted: List[Optional[LoomEpisode]] = []
+    parse_error_ids: List[str] = []
+    parse_error_msgs: List[str] = []
+
+    for ep_dict in episodes:
+        try:
+            converted.append(_dict_to_loom_episode(ep_dict))
+        except Exception as e:
+            converted.append(None)
+            parse_error_ids.append(ep_dict.get("episode_id", "<unknown>"))
+            parse_error_msgs.append(str(e))
+
+    return converted, parse_error_ids, parse_error_msgs
+
+
+# analyze_episodes results keyed by (episodes fingerprint, lever), LRU-bounded
+_RECOMMENDATION_CACHE: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_RECOMMENDATION_CACHE_SIZE = 64
+
+
+def _episodes_fingerprint(episodes: List[Dict[str, Any]]) -> str:
+    """Content hash of raw episode dicts, stable across key order."""
+    payload = json.dumps(episodes, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _safe_analyze(
+    loom_episodes: List[LoomEpisode], lever: str
+) -> Tuple[Any, Optional[str]]:
+    """Run analyze_episodes, returning (recommendation, None) or (None, error)."""
+    try:
+        return analyze_episodes(loom_episodes, lever=lever), None
+    except Exception as e:
+        return None, f"Error analyzing {lever}: {str(e)}"
+
+
+def _analyze_levers(
+    fingerprint: str, loom_episodes: List[LoomEpisode] | None, levers: List[str]
+) -> List[Tuple[Any, Optional[str]]]:
+    """
+    (recommendation, error) per lever, in lever order.
+
+    analyze_episodes is a pure function of its inputs, so results are
+    memoized per (fingerprint, lever). Uncached levers are analyzed
+    concurrently on a thread pool; the cache itself is only touched from
+    the calling thread. loom_episodes may be None only when every lever
+    is already cached.
+    """
+    results: Dict[str, Tuple[Any, Optional[str]]] = {}
+    pending: List[str] = []
+    for lever in levers:
+        key = (fingerprint, lever)
+        rec = _RECOMMENDATION_CACHE.get(key)
+        if rec is not None:
+            _RECOMMENDATION_CACHE.move_to_end(key)
+            results[lever] = (rec, None)
+        else:
+            pending.append(lever)
+
+    if len(pending) == 1:
+        results[pending[0]] = _safe_analyze(loom_episodes, pending[0])
+    elif pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            futures = [pool.submit(_safe_analyze, loom_episodes, lever) for lever in pending]
+        for lever, future in zip(pending, futures):
+            results[lever] = future.result()
+
+    for lever in pending:
+        rec, err = results[lever]
+        if err is None:
+            _RECOMMENDATION_CACHE[(fingerprint, lever)] = rec
+            if len(_RECOMMENDATION_CACHE) > _RECOMMENDATION_CACHE_SIZE:
+                _RECOMMENDATION_CACHE.popitem(last=False)
+
+    return [results[lever] for lever in levers]
+
+
 # ---------- Check 1: Episode Quality ----------
 
 
-def check_episode_quality(episodes: List[Dict[str, Any]]) -> ValidationCheckResult:
+def check_episode_quality(
+    episodes: List[Dict[str, Any]],
+    converted: ConvertedEpisodes | None = None,
+) -> ValidationCheckResult:
     """
     Invariant: Episode export is structurally sane.
 
@@ -57,6 +161,8 @@ def check_episode_quality(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
       - At least 1 episode
       - Each episode can be parsed as LoomEpisode
       - No missing required fields
+
+    converted may carry a _convert_episodes result shared with other checks.
     """
     name = "episode_quality"
     warnings: List[str] = []
@@ -72,25 +178,23 @@ def check_episode_quality(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
             details={"episode_count": 0},
         )
 
+    if converted is None:
+        converted = _convert_episodes(episodes)
+    loom_episodes, parse_error_ids, parse_error_msgs = converted
     missing_fields_total = 0
-    parse_errors: List[Tuple[str, str]] = []
 
-    for ep_dict in episodes:
-        ep_id = ep_dict.get("episode_id", "<unknown>")
-        try:
-            episode = _dict_to_loom_episode(ep_dict)
-        except Exception as e:
-            parse_errors.append((ep_id, str(e)))
+    for ep_dict, episode in zip(episodes, loom_episodes):
+        if episode is None:
             continue
 
         # Check for basic fields after parsing
-        required = ["mode", "outcome"]
-        missing = _require_keys(ep_dict, required)
-        missing_fields_total += len(missing)
+        missing_fields_total += len(_REQUIRED_EPISODE_FIELDS.difference(ep_dict))
 
-    if parse_errors:
-        errors.append(f"{len(parse_errors)} episodes failed to parse.")
-        warnings.append("See details.parse_errors for which episodes couldn't be loaded.")
+    if parse_error_ids:
+        errors.append(f"{len(parse_error_ids)} episodes failed to parse.")
+        warnings.append(
+            "See details.parse_error_ids / parse_error_msgs for which episodes couldn't be loaded."
+        )
 
     if missing_fields_total > 0:
         errors.append(f"{missing_fields_total} required fields missing across episodes.")
@@ -103,7 +207,8 @@ def check_episode_quality(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
         details={
             "episode_count": len(episodes),
             "missing_fields": missing_fields_total,
-            "parse_errors": parse_errors,
+            "parse_error_ids": parse_error_ids,
+            "parse_error_msgs": parse_error_msgs,
         },
     )
 
@@ -111,7 +216,10 @@ def check_episode_quality(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
 # ---------- Check 2: Recommendations ----------
 
 
-def check_recommendations(episodes: List[Dict[str, Any]]) -> ValidationCheckResult:
+def check_recommendations(
+    episodes: List[Dict[str, Any]],
+    converted: ConvertedEpisodes | None = None,
+) -> ValidationCheckResult:
     """
     Invariant: Recommendations produced by Quintet on these episodes are coherent.
 
@@ -119,6 +227,8 @@ def check_recommendations(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
       - We can run the analysis pipeline without throwing
       - Average confidence >= 0.6
       - No internal errors reported by analyzer
+
+    converted may carry a _convert_episodes result shared with other checks.
     """
     name = "recommendations"
     warnings: List[str] = []
@@ -138,39 +248,44 @@ def check_recommendations(episodes: List[Dict[str, Any]]) -> ValidationCheckResu
             details=details,
         )
 
-    # Convert raw dicts to LoomEpisode objects
-    try:
-        loom_episodes = [_dict_to_loom_episode(ep) for ep in episodes]
-    except Exception as e:
-        errors.append(f"Failed to convert episodes to LoomEpisode: {e}")
-        return ValidationCheckResult(
-            name=name,
-            passed=False,
-            warnings=warnings,
-            errors=errors,
-            details=details,
-        )
-
     # Analyze by policy lever
     levers = ["brain_temperature", "guardian_strictness", "perception_threshold"]
+    fingerprint = _episodes_fingerprint(episodes)
+
+    # Convert raw dicts to LoomEpisode objects, unless every lever is cached
+    loom_episodes = None
+    if any((fingerprint, lever) not in _RECOMMENDATION_CACHE for lever in levers):
+        if converted is None:
+            converted = _convert_episodes(episodes)
+        loom_episodes, _, parse_error_msgs = converted
+        if parse_error_msgs:
+            errors.append(f"Failed to convert episodes to LoomEpisode: {parse_error_msgs[0]}")
+            return ValidationCheckResult(
+                name=name,
+                passed=False,
+                warnings=warnings,
+                errors=errors,
+                details=details,
+            )
+
     quality_scores = []
     rec_errors = []
 
-    for lever in levers:
-        try:
-            rec = analyze_episodes(loom_episodes, lever=lever)
-            score = rec.confidence
-            quality_scores.append(score)
-            details["levers_tested"].append(
-                {
-                    "lever": lever,
-                    "action": rec.action,
-                    "confidence": score,
-                }
-            )
-        except Exception as e:
-            rec_errors.append(f"Error analyzing {lever}: {str(e)}")
-            errors.append(f"Error analyzing {lever}: {str(e)}")
+    for lever, (rec, err) in zip(levers, _analyze_levers(fingerprint, loom_episodes, levers)):
+        if err is not None:
+            rec_errors.append(err)
+            errors.append(err)
+            continue
+
+        score = rec.confidence
+        quality_scores.append(score)
+        details["levers_tested"].append(
+            {
+                "lever": lever,
+                "action": rec.action,
+                "confidence": score,
+            }
+        )
 
     if quality_scores:
         avg_confidence = sum(quality_scores) / len(quality_scores)
@@ -210,10 +325,8 @@ def check_stress_gates() -> ValidationCheckResult:
 
     try:
         # Check if CLI script exists
-        script_path = (
-            Path(__file__).resolve().parents[1] / "stress" / "run_pre_promote.py"
-        )
-        if not script_path.exists():
+        script_path = _STRESS_SCRIPT_PATH
+        if not _STRESS_SCRIPT_EXISTS:
             errors.append("Stress gate CLI script not found.")
             details["mode"] = "missing"
             return ValidationCheckResult(
@@ -253,14 +366,60 @@ def check_stress_gates() -> ValidationCheckResult:
 # ---------- Check 4: Receipt Chain / Persistence ----------
 
 
+# ReceiptStore per resolved receipts file, with the (st_ino, st_size) the
+# store last saw, LRU-bounded
+_STORE_CACHE: "OrderedDict[Path, Tuple[ReceiptStore, Optional[Tuple[int, int]]]]" = OrderedDict()
+_STORE_CACHE_SIZE = 8
+
+
+def _file_state(path: Path) -> Optional[Tuple[int, int]]:
+    """(st_ino, st_size) of path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size
+
+
+def _get_store(storage_path: Path) -> ReceiptStore:
+    """
+    Shared ReceiptStore per storage path.
+
+    ReceiptStore scans its file on construction to recover the chain head,
+    so repeated validations against the same file reuse one instance.
+    Stores are keyed on the resolved path and rebuilt whenever the file is
+    missing or no longer matches what the store last wrote, so a deleted,
+    replaced or externally appended file never chains onto a stale head.
+    """
+    path = Path(storage_path).resolve()
+    state = _file_state(path)
+    cached = _STORE_CACHE.get(path)
+    if cached is not None and state is not None and cached[1] == state:
+        _STORE_CACHE.move_to_end(path)
+        return cached[0]
+
+    store = ReceiptStore(storage_path=str(path))
+    _STORE_CACHE[path] = (store, state)
+    _STORE_CACHE.move_to_end(path)
+    if len(_STORE_CACHE) > _STORE_CACHE_SIZE:
+        _STORE_CACHE.popitem(last=False)
+    return store
+
+
+def _note_store_write(store: ReceiptStore) -> None:
+    """Record the file state after store appended, so the next reuse is valid."""
+    path = store.storage_path
+    if path in _STORE_CACHE:
+        _STORE_CACHE[path] = (store, _file_state(path))
+
+
 def check_receipt_chain(store_root: Path | None = None) -> ValidationCheckResult:
     """
     Invariant: Policy change receipts can be constructed, hashed, and persisted.
 
     Phase 1.1 advances from smoke test to actual round-trip:
       - Construct PolicyIntervention + PolicyExperiment + PolicyChangeReceipt
-      - Compute a stable hash via compute_receipt_hash
-      - Persist via ReceiptStore
+      - Persist via ReceiptStore, which computes the stable hash
       - Reload and verify hash stability
     """
     name = "receipt_chain"
@@ -300,33 +459,26 @@ def check_receipt_chain(store_root: Path | None = None) -> ValidationCheckResult
             guardian_notes="Test approval",
         )
 
-        # 2) Compute hash before persistence
-        pre_hash = compute_receipt_hash(receipt)
-        details["pre_hash_prefix"] = pre_hash[:16]
         details["receipt_id"] = getattr(receipt, "receipt_id", None)
 
-        # 3) Persist via ReceiptStore
+        # 2) Persist via ReceiptStore; append_receipt computes the pre-persistence hash
         if store_root is None:
             store_root = Path(".quintet_receipts_phase1_validation")
         store_root.mkdir(parents=True, exist_ok=True)
 
-        store = ReceiptStore(storage_path=str(store_root / "receipts.jsonl"))
+        store = _get_store(store_root / "receipts.jsonl")
         receipt_with_hash = store.append_receipt(receipt, verify_chain=True)
+        _note_store_write(store)
+        pre_hash = receipt_with_hash.receipt_hash
+        details["pre_hash_prefix"] = pre_hash[:16]
         details["saved_receipt_id"] = receipt.receipt_id
 
-        # 4) Reload and recompute hash
-        all_receipts = store.read_all_receipts(verify_chain=False)
-        if not all_receipts:
+        # 3) Reload the just-appended receipt and recompute hash
+        loaded_receipt = store.read_last_receipt()
+        if loaded_receipt is None:
             errors.append("Receipt was not persisted to store.")
         else:
-            # Find our receipt in the list
-            loaded_receipt = None
-            for rwh in all_receipts:
-                if rwh.receipt.receipt_id == receipt.receipt_id:
-                    loaded_receipt = rwh
-                    break
-
-            if loaded_receipt is None:
+            if loaded_receipt.receipt.receipt_id != receipt.receipt_id:
                 errors.append(
                     f"Receipt {receipt.receipt_id} not found after reload."
                 )
@@ -373,8 +525,11 @@ def run_phase1_validation(
     """
     checks: List[ValidationCheckResult] = []
 
-    checks.append(check_episode_quality(episodes))
-    checks.append(check_recommendations(episodes))
+    # Parse episodes once; both episode checks share the result
+    converted = _convert_episodes(episodes)
+
+    checks.append(check_episode_quality(episodes, converted=converted))
+    checks.append(check_recommendations(episodes, converted=converted))
     checks.append(check_stress_gates())
     checks.append(check_receipt_chain(store_root=store_root))
 
@@ -400,9 +555,10 @@ def summarize_phase1(summary: ValidationSummary) -> Dict[str, Any]:
     total = summary.total_checks
     warnings = summary.warnings_count
     failures = summary.failures
+    n_failures = len(failures)
 
     # Phase 1 passes if we have 3+ checks passing and no hard failures
-    overall_pass = (passed >= 3) and (len(failures) == 0)
+    overall_pass = (passed >= 3) and (n_failures == 0)
 
     if overall_pass:
         message = (
@@ -412,13 +568,13 @@ def summarize_phase1(summary: ValidationSummary) -> Dict[str, Any]:
     elif passed >= 3:
         message = (
             f"⚠️  Phase 1 VALIDATION INCOMPLETE (warnings only)\n"
-            f"   {len(failures)} check(s) have warnings but no hard failures.\n"
+            f"   {n_failures} check(s) have warnings but no hard failures.\n"
             f"   Review the warnings before Phase 2."
         )
     else:
         message = (
             f"❌ Phase 1 VALIDATION FAILED\n"
-            f"   {len(failures)} check(s) have hard failures.\n"
+            f"   {n_failures} check(s) have hard failures.\n"
             f"   Fix these before Phase 2."
         )
 
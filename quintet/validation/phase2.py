@@ -24,6 +24,7 @@ Invariant 7: Misconfiguration Fails Explicitly
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import time
@@ -33,11 +34,55 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to Response.json()
+    orjson = None
 
 from quintet.validation.types import ValidationCheckResult, ValidationSummary
 
 
-@dataclass
+# Shared session so health checks, episode triggers and call-log queries
+# reuse keep-alive connections to the Loom daemon and Quintet service.
+# Transient errors and gateway statuses are retried with backoff. Episode
+# creation (POST) is not idempotent: the server may have created the episode
+# before a read timeout or 502/503/504, so POSTs are only retried on connect
+# errors, where the request never reached it (urllib3 retries those for any
+# method).
+_SESSION = requests.Session()
+_RETRY = Retry(
+    total=3,
+    connect=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# Shortest /api/calls body that can hold a non-empty "calls" list; shorter
+# responses are treated as empty without decoding them
+_MIN_NONEMPTY_CALLS_BYTES = len(b'{"calls":[0]}')
+
+
+def _json(resp: requests.Response) -> Any:
+    """Decode a response body as JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError as e:
+            # Match Response.json() so RequestException handlers still apply
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    return resp.json()
+
+
+@dataclass(slots=True)
 class QuintetCallRecord:
     """Record of a call made to Quintet service."""
     call_id: str
@@ -50,7 +95,7 @@ class QuintetCallRecord:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyMetrics:
     """Metrics from a single episode execution."""
     episode_id: str
@@ -64,6 +109,22 @@ class PolicyMetrics:
     guardian_verdict: Optional[str] = None
 
 
+def _fail(
+    name: str,
+    errors: List[str],
+    warnings: List[str],
+    details: Dict[str, Any],
+) -> ValidationCheckResult:
+    """Failed ValidationCheckResult carrying a check's accumulated state."""
+    return ValidationCheckResult(
+        name=name,
+        passed=False,
+        errors=errors,
+        warnings=warnings,
+        details=details,
+    )
+
+
 def check_live_path(
     loom_daemon_url: str,
     quintet_service_url: str,
@@ -85,6 +146,11 @@ def check_live_path(
         - passed: True if >= 1 call recorded
         - details: {"calls_observed": int, "sample_call": Dict}
     """
+    loom_health_url = loom_daemon_url + "/health"
+    loom_episodes_url = loom_daemon_url + "/api/episodes"
+    quintet_health_url = quintet_service_url + "/health"
+    quintet_calls_url = quintet_service_url + "/api/calls"
+
     errors: List[str] = []
     warnings: List[str] = []
     details: Dict[str, Any] = {}
@@ -92,58 +158,34 @@ def check_live_path(
     try:
         # Step 1: Verify Loom daemon is reachable
         try:
-            loom_health = requests.get(
-                f"{loom_daemon_url}/health",
+            loom_health = _SESSION.get(
+                loom_health_url,
                 timeout=timeout_sec,
             )
             if loom_health.status_code != 200:
                 errors.append(f"Loom daemon unhealthy: {loom_health.status_code}")
-                return ValidationCheckResult(
-                    name="live_path",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("live_path", errors, warnings, details)
         except requests.ConnectionError as e:
             errors.append(f"Loom daemon unreachable at {loom_daemon_url}: {e}")
-            return ValidationCheckResult(
-                name="live_path",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("live_path", errors, warnings, details)
 
         # Step 2: Verify Quintet service is reachable
         try:
-            quintet_health = requests.get(
-                f"{quintet_service_url}/health",
+            quintet_health = _SESSION.get(
+                quintet_health_url,
                 timeout=timeout_sec,
             )
             if quintet_health.status_code != 200:
                 errors.append(f"Quintet service unhealthy: {quintet_health.status_code}")
-                return ValidationCheckResult(
-                    name="live_path",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("live_path", errors, warnings, details)
         except requests.ConnectionError as e:
             errors.append(f"Quintet service unreachable at {quintet_service_url}: {e}")
-            return ValidationCheckResult(
-                name="live_path",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("live_path", errors, warnings, details)
 
         # Step 3: Trigger test episode via Loom
         try:
-            episode_resp = requests.post(
-                f"{loom_daemon_url}/api/episodes",
+            episode_resp = _SESSION.post(
+                loom_episodes_url,
                 json={
                     "intent": test_episode_intent,
                     "mode": "test",
@@ -154,49 +196,45 @@ def check_live_path(
             )
             if episode_resp.status_code != 201:
                 errors.append(f"Failed to trigger test episode: {episode_resp.status_code}")
-                return ValidationCheckResult(
-                    name="live_path",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
-            episode_data = episode_resp.json()
+                return _fail("live_path", errors, warnings, details)
+            episode_data = _json(episode_resp)
             episode_id = episode_data.get("episode_id")
             if not episode_id:
                 errors.append("Test episode created but no episode_id returned")
-                return ValidationCheckResult(
-                    name="live_path",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("live_path", errors, warnings, details)
         except requests.RequestException as e:
             errors.append(f"Error triggering test episode: {e}")
-            return ValidationCheckResult(
-                name="live_path",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("live_path", errors, warnings, details)
 
-        # Step 4: Wait for call to be recorded and check Quintet logs
-        # Allow up to timeout_sec for call to propagate
-        time.sleep(1)  # Brief pause for async processing
+        # Step 4: Poll Quintet logs until the call is recorded
+        # Allow up to timeout_sec for call to propagate, backing off between polls
         try:
-            calls_resp = requests.get(
-                f"{quintet_service_url}/api/calls",
-                params={
-                    "episode_id": episode_id,
-                    "since": int((datetime.utcnow().timestamp() - 10) * 1000),  # last 10 sec
-                },
-                timeout=timeout_sec,
-            )
+            params = {
+                "episode_id": episode_id,
+                "since": int(time.time() * 1000) - 10_000,  # last 10 sec
+            }
+            deadline = time.monotonic() + timeout_sec
+            backoff = 0.1
+            while True:
+                calls_resp = _SESSION.get(
+                    quintet_calls_url,
+                    params=params,
+                    timeout=timeout_sec,
+                )
+                if calls_resp.status_code != 200:
+                    break
+                content_length = calls_resp.headers.get("Content-Length", "")
+                if content_length.isdigit() and int(content_length) < _MIN_NONEMPTY_CALLS_BYTES:
+                    calls = []
+                else:
+                    calls = _json(calls_resp).get("calls", [])
+                remaining = deadline - time.monotonic()
+                if calls or remaining <= 0:
+                    break
+                time.sleep(min(backoff, remaining))
+                backoff = min(backoff * 2, 1.0)
+
             if calls_resp.status_code == 200:
-                calls_data = calls_resp.json()
-                calls = calls_data.get("calls", [])
                 details["calls_observed"] = len(calls)
                 if calls:
                     details["sample_call"] = calls[0]
@@ -208,7 +246,7 @@ def check_live_path(
                         details=details,
                     )
                 else:
-                    warnings.append("No calls recorded yet (may propagate after brief delay)")
+                    warnings.append(f"No calls recorded within {timeout_sec}s")
                     return ValidationCheckResult(
                         name="live_path",
                         passed=False,
@@ -228,23 +266,11 @@ def check_live_path(
                 )
         except requests.RequestException as e:
             errors.append(f"Error querying Quintet calls: {e}")
-            return ValidationCheckResult(
-                name="live_path",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("live_path", errors, warnings, details)
 
     except Exception as e:
         errors.append(f"Unexpected error in live_path check: {e}")
-        return ValidationCheckResult(
-            name="live_path",
-            passed=False,
-            errors=errors,
-            warnings=warnings,
-            details=details,
-        )
+        return _fail("live_path", errors, warnings, details)
 
 
 def check_policy_effect(
@@ -272,6 +298,9 @@ def check_policy_effect(
     if test_policy_change is None:
         test_policy_change = {"brain_temperature": 0.8}  # Default safe change
 
+    loom_episodes_url = loom_daemon_url + "/api/episodes"
+    quintet_policy_change_url = quintet_service_url + "/api/test-policy-change"
+
     errors: List[str] = []
     warnings: List[str] = []
     details: Dict[str, Any] = {}
@@ -279,8 +308,8 @@ def check_policy_effect(
     try:
         # Step 1: Record baseline metrics
         try:
-            baseline_resp = requests.post(
-                f"{loom_daemon_url}/api/episodes",
+            baseline_resp = _SESSION.post(
+                loom_episodes_url,
                 json={
                     "intent": "policy_effect_baseline",
                     "mode": "test",
@@ -291,14 +320,8 @@ def check_policy_effect(
             )
             if baseline_resp.status_code != 201:
                 errors.append(f"Failed to create baseline episode: {baseline_resp.status_code}")
-                return ValidationCheckResult(
-                    name="policy_effect",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
-            baseline_data = baseline_resp.json()
+                return _fail("policy_effect", errors, warnings, details)
+            baseline_data = _json(baseline_resp)
             details["baseline_episode_id"] = baseline_data.get("episode_id")
             details["baseline"] = {
                 "latency_ms": baseline_data.get("latency_ms"),
@@ -307,48 +330,30 @@ def check_policy_effect(
             }
         except requests.RequestException as e:
             errors.append(f"Error running baseline episode: {e}")
-            return ValidationCheckResult(
-                name="policy_effect",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("policy_effect", errors, warnings, details)
 
         # Step 2: Apply policy change (safe test change only)
         try:
-            change_resp = requests.post(
-                f"{quintet_service_url}/api/test-policy-change",
+            change_resp = _SESSION.post(
+                quintet_policy_change_url,
                 json={"change": test_policy_change, "revert_after_ms": baseline_delay_sec * 1000 + 5000},
                 timeout=timeout_sec,
             )
             if change_resp.status_code != 200:
                 errors.append(f"Failed to apply policy change: {change_resp.status_code}")
-                return ValidationCheckResult(
-                    name="policy_effect",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("policy_effect", errors, warnings, details)
             details["policy_change_applied"] = test_policy_change
         except requests.RequestException as e:
             errors.append(f"Error applying policy change: {e}")
-            return ValidationCheckResult(
-                name="policy_effect",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("policy_effect", errors, warnings, details)
 
         # Step 3: Wait for policy change to take effect
         time.sleep(baseline_delay_sec)
 
         # Step 4: Run same test episode with new policy
         try:
-            changed_resp = requests.post(
-                f"{loom_daemon_url}/api/episodes",
+            changed_resp = _SESSION.post(
+                loom_episodes_url,
                 json={
                     "intent": "policy_effect_changed",
                     "mode": "test",
@@ -360,14 +365,8 @@ def check_policy_effect(
             )
             if changed_resp.status_code != 201:
                 errors.append(f"Failed to create changed episode: {changed_resp.status_code}")
-                return ValidationCheckResult(
-                    name="policy_effect",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
-            changed_data = changed_resp.json()
+                return _fail("policy_effect", errors, warnings, details)
+            changed_data = _json(changed_resp)
             details["changed_episode_id"] = changed_data.get("episode_id")
             details["after_change"] = {
                 "latency_ms": changed_data.get("latency_ms"),
@@ -376,13 +375,7 @@ def check_policy_effect(
             }
         except requests.RequestException as e:
             errors.append(f"Error running changed episode: {e}")
-            return ValidationCheckResult(
-                name="policy_effect",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("policy_effect", errors, warnings, details)
 
         # Step 5: Compare metrics
         baseline_latency = details.get("baseline", {}).get("latency_ms", 0)
@@ -417,23 +410,11 @@ def check_policy_effect(
                 )
         else:
             errors.append("Could not measure latency difference (missing baseline or changed metrics)")
-            return ValidationCheckResult(
-                name="policy_effect",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("policy_effect", errors, warnings, details)
 
     except Exception as e:
         errors.append(f"Unexpected error in policy_effect check: {e}")
-        return ValidationCheckResult(
-            name="policy_effect",
-            passed=False,
-            errors=errors,
-            warnings=warnings,
-            details=details,
-        )
+        return _fail("policy_effect", errors, warnings, details)
 
 
 def check_failure_mode(
@@ -456,6 +437,10 @@ def check_failure_mode(
         - passed: True if error is explicit (not silent)
         - details: {"error_receipt_found": bool, "error_message": str}
     """
+    loom_health_url = loom_daemon_url + "/health"
+    loom_episodes_url = loom_daemon_url + "/api/episodes"
+    loom_config_url = loom_daemon_url + "/api/test-config"
+
     errors: List[str] = []
     warnings: List[str] = []
     details: Dict[str, Any] = {}
@@ -463,33 +448,21 @@ def check_failure_mode(
     try:
         # Step 1: Verify Loom is reachable
         try:
-            loom_health = requests.get(
-                f"{loom_daemon_url}/health",
+            loom_health = _SESSION.get(
+                loom_health_url,
                 timeout=timeout_sec,
             )
             if loom_health.status_code != 200:
                 errors.append(f"Loom daemon unreachable")
-                return ValidationCheckResult(
-                    name="failure_mode",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("failure_mode", errors, warnings, details)
         except requests.ConnectionError as e:
             errors.append(f"Loom daemon unreachable: {e}")
-            return ValidationCheckResult(
-                name="failure_mode",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("failure_mode", errors, warnings, details)
 
         # Step 2: Temporarily configure Loom to use broken Quintet URL
         try:
-            config_resp = requests.post(
-                f"{loom_daemon_url}/api/test-config",
+            config_resp = _SESSION.post(
+                loom_config_url,
                 json={
                     "quintet_url": broken_quintet_url,
                     "revert_after_ms": 10000,  # Auto-revert after 10sec
@@ -504,8 +477,8 @@ def check_failure_mode(
 
         # Step 3: Trigger test episode with broken Quintet config
         try:
-            episode_resp = requests.post(
-                f"{loom_daemon_url}/api/episodes",
+            episode_resp = _SESSION.post(
+                loom_episodes_url,
                 json={
                     "intent": "failure_mode_test",
                     "mode": "test",
@@ -517,15 +490,9 @@ def check_failure_mode(
             )
             if episode_resp.status_code != 201:
                 errors.append(f"Test episode failed with status {episode_resp.status_code}")
-                return ValidationCheckResult(
-                    name="failure_mode",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("failure_mode", errors, warnings, details)
 
-            episode_data = episode_resp.json()
+            episode_data = _json(episode_resp)
             episode_id = episode_data.get("episode_id")
             has_error = episode_data.get("has_error", False)
             error_message = episode_data.get("error", "")
@@ -561,33 +528,15 @@ def check_failure_mode(
                 # No error - integration silently proceeded
                 errors.append("Loom proceeded without Quintet (silent fallback detected)")
                 details["error_receipt_found"] = False
-                return ValidationCheckResult(
-                    name="failure_mode",
-                    passed=False,
-                    errors=errors,
-                    warnings=warnings,
-                    details=details,
-                )
+                return _fail("failure_mode", errors, warnings, details)
 
         except requests.RequestException as e:
             errors.append(f"Error triggering failure mode test: {e}")
-            return ValidationCheckResult(
-                name="failure_mode",
-                passed=False,
-                errors=errors,
-                warnings=warnings,
-                details=details,
-            )
+            return _fail("failure_mode", errors, warnings, details)
 
     except Exception as e:
         errors.append(f"Unexpected error in failure_mode check: {e}")
-        return ValidationCheckResult(
-            name="failure_mode",
-            passed=False,
-            errors=errors,
-            warnings=warnings,
-            details=details,
-        )
+        return _fail("failure_mode", errors, warnings, details)
 
 
 def run_phase2_validation(
@@ -606,6 +555,9 @@ def run_phase2_validation(
     Returns:
         ValidationSummary with results of all 3 checks
     """
+    # Checks run one at a time: policy_effect compares behaviour before and
+    # after a policy change, and failure_mode reconfigures Loom, so traffic
+    # from a concurrent check would contaminate either one.
     checks = [
         check_live_path(loom_daemon_url, quintet_service_url),
         check_policy_effect(loom_daemon_url, quintet_service_url, test_policy_change),
@@ -631,12 +583,14 @@ def summarize_phase2(summary: ValidationSummary) -> Dict[str, Any]:
         - failures: List[str]
         - warnings: List[str]
     """
-    passed_checks = sum(1 for c in summary.checks if c.passed)
-    total_checks = len(summary.checks)
-    failures = summary.failures
+    # Counts come from the summary's cached aggregates; only the warning
+    # messages themselves need a pass over the checks
+    passed_checks = summary.passed_checks
+    total_checks = summary.total_checks
+    failures = list(summary.failures)
     warnings_list = [w for c in summary.checks for w in c.warnings]
 
-    overall_pass = summary.all_passed and len(failures) == 0
+    overall_pass = summary.all_passed
 
     return {
         "overall_pass": overall_pass,
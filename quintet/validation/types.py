@@ -7,11 +7,12 @@ ValidationSummary aggregates multiple checks into a coherent picture.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationCheckResult:
     """
     Atomic validation result for a single named check.
@@ -49,38 +50,39 @@ class ValidationCheckResult:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationSummary:
     """
     Rollup of multiple ValidationCheckResult entries.
 
     This is what the CLI prints and what higher phases can consume.
-    Provides aggregated views over a set of checks.
+    Provides aggregated views over a set of checks, each computed on first
+    access and cached, so checks must not be modified after construction.
     """
 
     checks: List[ValidationCheckResult]
 
-    @property
+    @functools.cached_property
     def passed_checks(self) -> int:
         """Count of checks that passed."""
         return sum(1 for c in self.checks if c.passed)
 
-    @property
+    @functools.cached_property
     def warnings_count(self) -> int:
         """Total warning count across all checks."""
         return sum(len(c.warnings) for c in self.checks)
 
-    @property
+    @functools.cached_property
     def failures(self) -> List[str]:
         """Names of checks that have failures."""
         return [c.name for c in self.checks if c.has_failures]
 
-    @property
+    @functools.cached_property
     def all_passed(self) -> bool:
         """True if all checks passed."""
         return all(c.passed for c in self.checks)
 
-    @property
+    @functools.cached_property
     def total_checks(self) -> int:
         """Total number of checks."""
         return len(self.checks)
@@ -13,12 +13,16 @@ Usage:
 """
 
 import argparse
+import ast
+import functools
 import os
 import re
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterator, NamedTuple, Optional
 
 
 class CheckResult(NamedTuple):
@@ -27,39 +31,235 @@ class CheckResult(NamedTuple):
     critical: bool = False
 
 
-def check_no_secrets_in_code() -> CheckResult:
-    """Check for hardcoded secrets in source files."""
-    secret_patterns = [
-        r'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\'][^"\']{10,}["\']',
-        r'(?i)(secret|password|passwd|pwd)\s*[=:]\s*["\'][^"\']{8,}["\']',
-        r'(?i)(token)\s*[=:]\s*["\'][^"\']{20,}["\']',
-        r'sk-[a-zA-Z0-9]{20,}',  # OpenAI keys
-        r'ghp_[a-zA-Z0-9]{36}',  # GitHub tokens
-        r'AKIA[0-9A-Z]{16}',  # AWS access keys
+# Patterns and path filters are built once at import, not per check call.
+# Patterns are ASCII bytes so file content is scanned without decoding.
+_SECRET_PATTERNS: tuple[re.Pattern, ...] = tuple(re.compile(p) for p in (
+    rb'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\'][^"\']{10,}["\']',
+    rb'(?i)(secret|password|passwd|pwd)\s*[=:]\s*["\'][^"\']{8,}["\']',
+    rb'(?i)(token)\s*[=:]\s*["\'][^"\']{20,}["\']',
+    rb'sk-[a-zA-Z0-9]{20,}',  # OpenAI keys
+    rb'ghp_[a-zA-Z0-9]{36}',  # GitHub tokens
+    rb'AKIA[0-9A-Z]{16}',  # AWS access keys
+))
+
+_DEBUG_PATTERNS: tuple[re.Pattern, ...] = tuple(re.compile(p) for p in (
+    rb'breakpoint\(\)',
+    rb'import\s+pdb',
+    rb'pdb\.set_trace\(\)',
+    rb'console\.log\(',  # In Python files (copy-paste error)
+    rb'print\(["\']DEBUG',
+    rb'# TODO.*REMOVE',
+    rb'# HACK',
+    rb'debugger;',
+))
+
+# Literals at least one of which every pattern above needs to match. Most
+# files contain none, and a bytes `in` test is far cheaper than running
+# each regex, so files without any skip the regex pass. Secret literals
+# are lowercase and tested against lowercased content, since several
+# secret patterns are case-insensitive.
+_SECRET_LITERALS = (b'api', b'secret', b'passw', b'pwd', b'token', b'sk-', b'ghp_', b'akia')
+_DEBUG_LITERALS = (
+    b'breakpoint(', b'pdb', b'console.log', b'DEBUG', b'# TODO', b'# HACK', b'debugger;',
+)
+
+# Statement attributes holding nested statements (handlers and cases hold
+# ExceptHandler / match_case nodes, which carry their own body)
+_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+_SECRET_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.tsx', '.jsx', '.json', '.yaml', '.yml'})
+_DEBUG_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.tsx', '.jsx'})
+# Files whose content is read for the secret, debug and type-hint checks
+_SOURCE_EXTENSIONS = _SECRET_EXTENSIONS | _DEBUG_EXTENSIONS
+
+_MAX_FILE_SIZE_MB = 5
+
+# Secret and debug scans look at most this far into a file; large data
+# fixtures rarely hide either past their first few hundred KB
+_MAX_SCAN_BYTES = 512 * 1024
+
+# Files read ahead of the checks during a scan, bounding buffered content
+_READ_AHEAD = 64
+
+# Common non-source directories
+_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
+# Files below directories with these names are exempt from the type-hint check
+_TYPE_HINT_EXEMPT_DIRS = frozenset({'tests'})
+
+
+class _TreeScan(NamedTuple):
+    """Findings from a single pass over the source tree."""
+    secrets: list[str]
+    debug_code: list[str]
+    missing_hints: list[str]
+    large_files: list[str]
+
+
+def _walk_scandir(
+    root: str,
+    skip_dirs: frozenset[str],
+    flag_dirs: frozenset[str] = frozenset(),
+    flagged: bool = False,
+) -> Iterator[tuple[os.DirEntry, bool]]:
+    """
+    Yield (entry, flagged) for every file under root.
+
+    Directories named in skip_dirs are pruned before descending, and
+    symlinked directories are not followed. flagged is True for files
+    below a directory named in flag_dirs. Each directory's files come
+    before its subdirectories, matching os.walk order.
+    """
+    subdirs = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in skip_dirs and not entry.is_symlink():
+                        subdirs.append((entry.path, flagged or entry.name in flag_dirs))
+                else:
+                    yield entry, flagged
+    except OSError:
+        return
+
+    for subdir, subdir_flagged in subdirs:
+        yield from _walk_scandir(subdir, skip_dirs, flag_dirs, subdir_flagged)
+
+
+def _read_file(
+    entry: os.DirEntry, type_hint_exempt: bool
+) -> tuple[str, str, Optional[bytes], Optional[int], bool]:
+    """Stat and, for source files, read one walked file (see _collect_files)."""
+    # The walk starts at '.', so drop its leading './' for reporting
+    filepath = entry.path[2:]
+    suffix = os.path.splitext(entry.name)[1]
+    try:
+        size = entry.stat().st_size
+    except OSError:
+        size = None
+
+    content = None
+    if suffix in _SOURCE_EXTENSIONS:
+        try:
+            with open(entry.path, 'rb') as f:
+                content = f.read() if suffix == '.py' else f.read(_MAX_SCAN_BYTES)
+        except Exception:
+            pass
+
+    return filepath, suffix, content, size, type_hint_exempt
+
+
+def _collect_files() -> Iterator[tuple[str, str, Optional[bytes], Optional[int], bool]]:
+    """
+    Walk the tree once, yielding (path, suffix, content, size, type_hint_exempt).
+
+    content is read as raw bytes, only for source files the content checks
+    look at, and only the first _MAX_SCAN_BYTES of non-Python files (Python
+    files are read whole for the type-hint check). content and size are
+    None when the file can't be read or stat'ed.
+
+    Files are read on a thread pool so disk waits overlap, with at most
+    _READ_AHEAD reads in flight; results are still yielded in walk order.
+    """
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor() as pool:
+        for entry, type_hint_exempt in _walk_scandir('.', _SKIP_DIRS, _TYPE_HINT_EXEMPT_DIRS):
+            pending.append(pool.submit(_read_file, entry, type_hint_exempt))
+            if len(pending) >= _READ_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _secret_check(filepath: str, suffix: str, content: bytes, violations: list[str]) -> None:
+    if suffix not in _SECRET_EXTENSIONS:
+        return
+    folded = content[:_MAX_SCAN_BYTES].lower()
+    if not any(literal in folded for literal in _SECRET_LITERALS):
+        return
+    for pattern in _SECRET_PATTERNS:
+        if pattern.search(content, 0, _MAX_SCAN_BYTES):
+            violations.append(f"{filepath}: Potential secret found")
+            return
+
+
+def _debug_check(filepath: str, suffix: str, content: bytes, violations: list[str]) -> None:
+    if suffix not in _DEBUG_EXTENSIONS:
+        return
+    if not any(literal in content for literal in _DEBUG_LITERALS):
+        return
+    for pattern in _DEBUG_PATTERNS:
+        if pattern.search(content, 0, _MAX_SCAN_BYTES):
+            violations.append(f"{filepath}: Contains debug code ({pattern.pattern.decode()})")
+            return
+
+
+def _iter_statements(tree: ast.Module) -> Iterator[ast.AST]:
+    """
+    Yield every statement in tree, including those nested in blocks.
+
+    Function definitions are always statements, so this finds the same
+    ones as ast.walk without visiting the far more numerous expression
+    nodes. Except handlers and match cases are yielded too, as the
+    containers of their bodies.
+    """
+    stack: list[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        yield node
+        for field in _BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if block:
+                stack.extend(reversed(block))
+
+
+def _type_hint_check(filepath: str, suffix: str, content: bytes, missing_hints: list[str]) -> None:
+    if suffix != '.py':
+        return
+
+    # Find public functions and methods without return type hints
+    try:
+        tree = ast.parse(content, filename=filepath)
+    except (SyntaxError, ValueError):
+        return
+
+    untyped = [
+        node for node in _iter_statements(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and node.returns is None
+        and not node.name.startswith('_')
     ]
+    untyped.sort(key=lambda node: node.lineno)
+    for node in untyped:
+        missing_hints.append(f"{filepath}: {node.name}()")
+
+
+def _large_file_check(filepath: str, size: int, large_files: list[str]) -> None:
+    size_mb = size / (1024 * 1024)
+    if size_mb > _MAX_FILE_SIZE_MB:
+        large_files.append(f"{filepath}: {size_mb:.1f}MB")
+
+
+def _scan_tree() -> _TreeScan:
+    """Read each file once and run every per-file check against it."""
+    scan = _TreeScan(secrets=[], debug_code=[], missing_hints=[], large_files=[])
+
+    for filepath, suffix, content, size, type_hint_exempt in _collect_files():
+        if size is not None:
+            _large_file_check(filepath, size, scan.large_files)
+        if content is not None:
+            _secret_check(filepath, suffix, content, scan.secrets)
+            if not type_hint_exempt:
+                _type_hint_check(filepath, suffix, content, scan.missing_hints)
+            _debug_check(filepath, suffix, content, scan.debug_code)
+
+    return scan
 
-    violations = []
-    source_extensions = {'.py', '.js', '.ts', '.tsx', '.jsx', '.json', '.yaml', '.yml'}
-
-    for root, _, files in os.walk('.'):
-        # Skip common non-source directories
-        if any(skip in root for skip in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']):
-            continue
-
-        for file in files:
-            if Path(file).suffix not in source_extensions:
-                continue
-
-            filepath = Path(root) / file
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-                for pattern in secret_patterns:
-                    matches = re.findall(pattern, content)
-                    if matches:
-                        violations.append(f"{filepath}: Potential secret found")
-                        break
-            except Exception:
-                pass
+
+def check_no_secrets_in_code(scan: Optional[_TreeScan] = None) -> CheckResult:
+    """Check for hardcoded secrets in source files."""
+    if scan is None:
+        scan = _scan_tree()
+    violations = scan.secrets
 
     if violations:
         return CheckResult(
@@ -70,39 +270,11 @@ def check_no_secrets_in_code() -> CheckResult:
     return CheckResult(passed=True, message="No hardcoded secrets found")
 
 
-def check_type_hints() -> CheckResult:
+def check_type_hints(scan: Optional[_TreeScan] = None) -> CheckResult:
     """Check that Python functions have type hints."""
-    missing_hints = []
-
-    for root, _, files in os.walk('.'):
-        if any(skip in root for skip in ['.git', 'node_modules', '__pycache__', '.venv', 'venv', 'tests']):
-            continue
-
-        for file in files:
-            if not file.endswith('.py'):
-                continue
-
-            filepath = Path(root) / file
-            try:
-                content = filepath.read_text(encoding='utf-8')
-                # Find function definitions without return type hints
-                # This is a simple check - not perfect but catches obvious cases
-                untyped = re.findall(
-                    r'^def\s+(\w+)\s*\([^)]*\)\s*:',
-                    content,
-                    re.MULTILINE
-                )
-                typed = re.findall(
-                    r'^def\s+(\w+)\s*\([^)]*\)\s*->',
-                    content,
-                    re.MULTILINE
-                )
-
-                for func in untyped:
-                    if func not in typed and not func.startswith('_'):
-                        missing_hints.append(f"{filepath}: {func}()")
-            except Exception:
-                pass
+    if scan is None:
+        scan = _scan_tree()
+    missing_hints = scan.missing_hints
 
     if missing_hints:
         return CheckResult(
@@ -134,39 +306,11 @@ def check_tests_exist() -> CheckResult:
     return CheckResult(passed=True, message=f"Found {len(test_files)} test file(s)")
 
 
-def check_no_debug_code() -> CheckResult:
+def check_no_debug_code(scan: Optional[_TreeScan] = None) -> CheckResult:
     """Check for leftover debug code."""
-    debug_patterns = [
-        r'breakpoint\(\)',
-        r'import\s+pdb',
-        r'pdb\.set_trace\(\)',
-        r'console\.log\(',  # In Python files (copy-paste error)
-        r'print\(["\']DEBUG',
-        r'# TODO.*REMOVE',
-        r'# HACK',
-        r'debugger;',
-    ]
-
-    violations = []
-    source_extensions = {'.py', '.js', '.ts', '.tsx', '.jsx'}
-
-    for root, _, files in os.walk('.'):
-        if any(skip in root for skip in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']):
-            continue
-
-        for file in files:
-            if Path(file).suffix not in source_extensions:
-                continue
-
-            filepath = Path(root) / file
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-                for pattern in debug_patterns:
-                    if re.search(pattern, content):
-                        violations.append(f"{filepath}: Contains debug code ({pattern})")
-                        break
-            except Exception:
-                pass
+    if scan is None:
+        scan = _scan_tree()
+    violations = scan.debug_code
 
     if violations:
         return CheckResult(
@@ -177,28 +321,16 @@ def check_no_debug_code() -> CheckResult:
     return CheckResult(passed=True, message="No debug code found")
 
 
-def check_large_files() -> CheckResult:
+def check_large_files(scan: Optional[_TreeScan] = None) -> CheckResult:
     """Check for unusually large files that might be mistakes."""
-    max_size_mb = 5
-    large_files = []
-
-    for root, _, files in os.walk('.'):
-        if any(skip in root for skip in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']):
-            continue
-
-        for file in files:
-            filepath = Path(root) / file
-            try:
-                size_mb = filepath.stat().st_size / (1024 * 1024)
-                if size_mb > max_size_mb:
-                    large_files.append(f"{filepath}: {size_mb:.1f}MB")
-            except Exception:
-                pass
+    if scan is None:
+        scan = _scan_tree()
+    large_files = scan.large_files
 
     if large_files:
         return CheckResult(
             passed=False,
-            message=f"Large files detected (>{max_size_mb}MB):\n" + "\n".join(large_files),
+            message=f"Large files detected (>{_MAX_FILE_SIZE_MB}MB):\n" + "\n".join(large_files),
             critical=False
         )
     return CheckResult(passed=True, message="No unusually large files")
@@ -206,12 +338,14 @@ def check_large_files() -> CheckResult:
 
 def run_all_checks(strict: bool = False) -> int:
     """Run all invariant checks and return exit code."""
+    # One walk of the tree serves every file-based check
+    scan = _scan_tree()
     checks = [
-        ("Secrets Check", check_no_secrets_in_code),
-        ("Type Hints", check_type_hints),
+        ("Secrets Check", functools.partial(check_no_secrets_in_code, scan)),
+        ("Type Hints", functools.partial(check_type_hints, scan)),
         ("Tests Exist", check_tests_exist),
-        ("Debug Code", check_no_debug_code),
-        ("Large Files", check_large_files),
+        ("Debug Code", functools.partial(check_no_debug_code, scan)),
+        ("Large Files", functools.partial(check_large_files, scan)),
     ]
 
     print("=" * 60)
@@ -21,6 +21,9 @@ from quintet.stress.coverage import CoverageTracker
 from quintet.stress.promotion import StressPromotionManager, PromotionDecision
 from quintet.core.types import RESOURCE_LIMITS
 
+# Budget recorded for every simulated run; record_runs_bulk only reads it
+_BUDGET = {"tier": "standard"}
+
 
 def print_section(title: str):
     """Print a section header."""
@@ -53,18 +56,21 @@ def main():
     )
 
     print("Recording 25 stress test runs for 'tolerance_sweep' scenario...")
-    for i in range(25):
-        passed = i < 24  # 24 pass, 1 fails
-        tracker.record_run({
+    # 24 pass, 1 fails; recorded in one transaction
+    runs = [
+        {
             "run_id": f"run-{i:03d}",
             "scenario_id": "tolerance_sweep",
             "case_id": f"case-{i}",
-            "passed": passed,
-            "confidence": 0.82 if passed else 0.45,
-            "outcome": "success" if passed else "failed",
+            "passed": i < 24,
+            "confidence": 0.82 if i < 24 else 0.45,
+            "outcome": "success" if i < 24 else "failed",
             "duration_ms": 150.0,
-            "budget_used": {"tier": "standard"}
-        })
+            "budget_used": _BUDGET
+        }
+        for i in range(25)
+    ]
+    tracker.record_runs_bulk(runs)
 
     stats = tracker.get_scenario_stats("tolerance_sweep")
     print(f"  Total runs: {stats['total_runs']}")
@@ -9,14 +9,13 @@ See: quintet/validation/phase1.py for the invariants.
 """
 
 import sys
-import importlib.util
 from pathlib import Path
 
-# Load validate_phase_1_cli dynamically since scripts/ isn't a package
-cli_path = Path(__file__).parent / "validate_phase_1_cli.py"
-spec = importlib.util.spec_from_file_location("validate_phase_1_cli", cli_path)
-validate_phase_1_cli = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(validate_phase_1_cli)
+# scripts/ isn't a package; put it on the path so the CLI imports as a
+# regular (cached) module
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validate_phase_1_cli
 
 if __name__ == "__main__":
     raise SystemExit(validate_phase_1_cli.main())
@@ -39,6 +38,7 @@ if __name__ == "__main__":
 
 import json
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -71,26 +71,15 @@ def validate_episode_quality(episodes: List[LoomEpisode]) -> Dict[str, Any]:
 
     stats = {
         "total": len(episodes),
-        "by_mode": {},
-        "by_domain": {},
-        "by_outcome": {},
-        "missing_fields": 0,
+        "by_mode": Counter(ep.mode for ep in episodes),
+        "by_domain": Counter(ep.domain for ep in episodes),
+        "by_outcome": Counter(ep.outcome for ep in episodes),
+        # Episodes missing a required field
+        "missing_fields": sum(
+            1 for ep in episodes if not ep.episode_id or not ep.mode or not ep.domain
+        ),
     }
 
-    for ep in episodes:
-        # Count by mode
-        stats["by_mode"][ep.mode] = stats["by_mode"].get(ep.mode, 0) + 1
-
-        # Count by domain
-        stats["by_domain"][ep.domain] = stats["by_domain"].get(ep.domain, 0) + 1
-
-        # Count by outcome
-        stats["by_outcome"][ep.outcome] = stats["by_outcome"].get(ep.outcome, 0) + 1
-
-        # Check for required fields
-        if not ep.episode_id or not ep.mode or not ep.domain:
-            stats["missing_fields"] += 1
-
     print(f"   ✓ Total episodes: {stats['total']}")
     print(f"   ✓ Modes: {dict(stats['by_mode'])}")
     print(f"   ✓ Domains: {dict(stats['by_domain'])}")
@@ -70,14 +70,14 @@ def main(argv: list[str] | None = None) -> int:
 
     print(f"\n📖 Loading episodes from {fixture_path}...")
     try:
-        fixture_data = fixture_path.read_text()
-        data = json.loads(fixture_data)
+        fixture_bytes = fixture_path.read_bytes()
+        data = json.loads(fixture_bytes)
     except Exception as e:
         print(f"❌ Failed to load fixture: {e}")
         return 1
 
-    # Compute fixture hash for receipt
-    fixture_hash = hashlib.sha256(fixture_data.encode()).hexdigest()
+    # Compute fixture hash for receipt from the bytes as read
+    fixture_hash = hashlib.sha256(fixture_bytes).hexdigest()
 
     # Adjust if your fixture wraps episodes under a key
     episodes = data.get("episodes", data)
@@ -7,6 +7,8 @@ executor, coverage tracking, edge cases, and promotion.
 """
 
 import pytest
+import dataclasses
+import gc
 import json
 import tempfile
 from pathlib import Path
@@ -18,7 +20,7 @@ from quintet.stress.coverage import CoverageTracker, CoverageGap
 from quintet.stress.edge_cases import (
     EdgeCase, EdgeCaseRegistry, get_edge_case_registry, register_edge_case
 )
-from quintet.stress.promotion import StressPromotionManager, PromotionDecision
+from quintet.stress.promotion import StressPromotionManager, PromotionDecision, SummaryEntry
 from quintet.stress.decorator import stress_test, mark_stress_test_coverage
 
 
@@ -73,6 +75,67 @@ edge_cases:
             finally:
                 Path(f.name).unlink()
 
+    def test_scenario_yaml_cache(self, tmp_path, monkeypatch):
+        """Unchanged files are parsed once; cached loads are independent and refresh on change."""
+        import yaml
+
+        path = tmp_path / "scenario.yaml"
+        path.write_text(
+            'scenario_id: "cached"\nname: "Cached"\ndescription: "Test"\n'
+            'category: "edge_cases"\ndomain: "algebra"\n'
+            'edge_cases:\n  - case_id: "case_1"\n'
+        )
+
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda f, Loader: calls.append(1) or real_load(f, Loader))
+
+        first = StressScenario.from_yaml(str(path))
+        first.edge_cases.append({"case_id": "mutated"})
+        second = StressScenario.from_yaml(str(path))
+
+        assert len(calls) == 1
+        assert [c["case_id"] for c in second.edge_cases] == ["case_1"]
+
+        path.write_text(path.read_text().replace('"Cached"', '"Cached again"'))
+        assert StressScenario.from_yaml(str(path)).name == "Cached again"
+        assert len(calls) == 2
+
+    def test_scenario_metadata_only(self, tmp_path):
+        """Metadata-only load reads top-level scalars and skips nested values."""
+        path = tmp_path / "scenario.yaml"
+        path.write_text(
+            'scenario_id: "meta"\n'
+            'stress_config:\n  name: "nested"\n  budget_tiers: [{tier: "light"}]\n'
+            'name: "Meta"\ncategory: "budget_sweep"\ndomain: "algebra"\n'
+            'edge_cases:\n  - case_id: "case_1"\n    category: "overflow"\n'
+        )
+
+        scenario = StressScenario.from_yaml_metadata_only(str(path))
+        assert scenario.scenario_id == "meta"
+        assert scenario.name == "Meta"
+        assert scenario.category == "budget_sweep"
+        assert scenario.domain == "algebra"
+        assert scenario.description == ""
+        assert scenario.edge_cases == []
+        assert scenario.stress_config == {}
+
+    def test_scenario_uses_slots(self):
+        """Scenarios carry no per-instance __dict__ and still pickle for run_batch."""
+        import pickle
+
+        scenario = StressScenario(
+            scenario_id="test-001",
+            name="Test",
+            description="Test",
+            category="edge_cases",
+            domain="algebra",
+            edge_cases=[{"case_id": "case_1"}]
+        )
+
+        assert not hasattr(scenario, "__dict__")
+        assert pickle.loads(pickle.dumps(scenario)) == scenario
+
     def test_scenario_to_dict(self):
         """Convert scenario to dictionary."""
         scenario = StressScenario(
@@ -87,6 +150,24 @@ edge_cases:
         assert data["scenario_id"] == "test-001"
         assert "stress_config" in data
 
+    def test_scenario_to_dict_matches_fields_without_copying(self):
+        """to_dict covers every field and shares nested containers."""
+        from dataclasses import asdict
+
+        scenario = StressScenario(
+            scenario_id="test-001",
+            name="Test",
+            description="Test",
+            category="edge_cases",
+            domain="algebra",
+            edge_cases=[{"case_id": "case_1"}]
+        )
+
+        data = scenario.to_dict()
+        assert data == asdict(scenario)
+        assert data["edge_cases"] is scenario.edge_cases
+        assert json.loads(scenario.to_json()) == data
+
     def test_scenario_get_edge_cases(self):
         """Get edge cases with filtering."""
         scenario = StressScenario(
@@ -106,6 +187,28 @@ edge_cases:
         assert len(overflow_cases) == 2
         assert all(c["category"] == "overflow" for c in overflow_cases)
 
+    def test_scenario_get_edge_cases_reflects_edits(self):
+        """Filtered lookups see appended, replaced and recategorized edge cases."""
+        scenario = StressScenario(
+            scenario_id="test-001",
+            name="Test",
+            description="Test",
+            category="edge_cases",
+            domain="algebra",
+            edge_cases=[{"case_id": "case_1", "category": "overflow"}]
+        )
+
+        assert scenario.get_edge_cases(category="underflow") == []
+        scenario.edge_cases.append({"case_id": "case_2", "category": "underflow"})
+        assert [c["case_id"] for c in scenario.get_edge_cases(category="underflow")] == ["case_2"]
+
+        scenario.edge_cases[0] = {"case_id": "case_3", "category": "overflow"}
+        scenario.edge_cases[1]["category"] = "overflow"
+        assert scenario.get_edge_cases(category="underflow") == []
+        assert [c["case_id"] for c in scenario.get_edge_cases(category="overflow")] == [
+            "case_3", "case_2"
+        ]
+
     def test_scenario_get_budget_tiers(self):
         """Get budget tiers from scenario."""
         scenario = StressScenario(
@@ -148,6 +251,27 @@ edge_cases:
         assert criteria["min_runs"] == 10
 
 
+class TestStressPlugin:
+    """Tests for the stress pytest plugin's collection hook."""
+
+    def test_collect_file_skips_non_scenario_paths(self):
+        """Non-YAML files and YAML outside scenario directories are not collected."""
+        from quintet.stress import pytest_plugin
+
+        assert pytest_plugin.pytest_collect_file(None, Path("tests/stress/scenarios/a.py")) is None
+        assert pytest_plugin.pytest_collect_file(None, Path("config/models.yaml")) is None
+        assert pytest_plugin._SCENARIO_DIR_CACHE[Path("config")] is False
+        assert pytest_plugin._SCENARIO_DIR_RE.search("tests/stress/scenarios")
+        assert pytest_plugin._SCENARIO_DIR_RE.search("tests/stress/scenario")
+
+    def test_executor_shared_across_tests(self):
+        """Stress items reuse one executor per session."""
+        from quintet.stress import pytest_plugin
+
+        assert isinstance(pytest_plugin._executor(), StressExecutor)
+        assert pytest_plugin._executor() is pytest_plugin._executor()
+
+
 class TestStressExecutor:
     """Tests for StressExecutor."""
 
@@ -205,6 +329,68 @@ class TestStressExecutor:
         # Should fall back to "standard"
         assert "budget_used" in result.to_dict()
 
+    def test_run_batch_preserves_order(self, executor, sample_scenario):
+        """Batch execution returns one result per item, in input order."""
+        cases = [
+            dict(sample_scenario.edge_cases[0], case_id=f"case_{i}") for i in range(3)
+        ]
+
+        results = executor.run_batch(
+            [(sample_scenario, case) for case in cases],
+            budget_tier="light",
+            max_workers=2
+        )
+
+        assert [r.case_id for r in results] == ["case_0", "case_1", "case_2"]
+        assert all(isinstance(r, StressTestResult) for r in results)
+        assert executor.run_batch([]) == []
+
+    def test_deadline_check_raises_when_expired(self, executor):
+        """Monotonic deadline check raises TimeoutException once passed."""
+        import time
+
+        executor._check_deadline(time.monotonic_ns() + 10**9, timeout_ms=1000)
+        with pytest.raises(TimeoutException):
+            executor._check_deadline(time.monotonic_ns() - 1, timeout_ms=5)
+
+    @pytest.mark.parametrize("success,confidence,expected", [
+        (True, 0.9, ("success", True, 0)),
+        (True, 0.6, ("degraded", False, 1)),
+        (True, 0.3, ("failed", False, 0)),
+        (False, 0.9, ("failed", True, 0)),
+    ])
+    def test_validate_result_outcomes(self, executor, success, confidence, expected):
+        """Outcome mapping covers success, degraded and failed results."""
+        edge_case = {"expected_result": {"confidence_min": 0.7}}
+        passed, outcome, _, warnings = executor._validate_result(
+            result={"success": success, "confidence": confidence},
+            edge_case=edge_case,
+            expected_behavior={},
+            tolerance=None
+        )
+
+        assert (outcome, passed, len(warnings)) == expected
+
+    def test_tolerance_for_case_defaults_and_overrides(self, executor):
+        """Edge cases share the default tolerance unless they override it."""
+        default = executor._get_tolerance_for_case({"case_id": "plain"})
+        assert default is executor._get_tolerance_for_case({"tolerance_config": {}})
+        assert (default.absolute, default.relative, default.max_magnitude) == (1e-9, 1e-6, 1e12)
+
+        custom = executor._get_tolerance_for_case(
+            {"tolerance_config": {"absolute": 1e-12, "note": "ignored"}}
+        )
+        assert custom.absolute == 1e-12
+        assert custom.relative == 1e-6
+        assert default.absolute == 1e-9
+        assert custom is executor._get_tolerance_for_case(
+            {"tolerance_config": {"absolute": 1e-12}}
+        )
+
+        # Shared configs cannot be changed under other runs
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            custom.absolute = 1.0
+
     def test_stress_test_result_to_dict(self):
         """Convert result to dictionary."""
         result = StressTestResult(
@@ -222,6 +408,59 @@ class TestStressExecutor:
         assert data["passed"] is True
         assert data["outcome"] == "success"
 
+    def test_result_to_dict_materializes_empty_containers(self):
+        """Unset container fields serialize as empty dicts and lists."""
+        data = StressTestResult(
+            run_id="run-001", scenario_id="scenario-001", case_id="case-001", passed=False
+        ).to_dict()
+
+        assert data["budget_used"] == {}
+        assert data["tolerance_used"] == {}
+        assert data["receipts"] == []
+        assert data["warnings"] == []
+
+    def test_result_to_dict_serializes_receipts(self):
+        """Receipts are serialized through their own to_dict."""
+        from quintet.core.types import Receipt
+
+        receipt = Receipt(receipt_type="stress_run")
+        data = StressTestResult(
+            run_id="run-001",
+            scenario_id="scenario-001",
+            case_id="case-001",
+            passed=True,
+            receipts=[receipt]
+        ).to_dict()
+
+        assert data["receipts"] == [receipt.to_dict()]
+
+    def test_result_and_edge_case_use_slots(self):
+        """Result and edge case instances carry no per-instance __dict__."""
+        result = StressTestResult(
+            run_id="run-001", scenario_id="scenario-001", case_id="case-001", passed=True
+        )
+        case = EdgeCase(
+            case_id="case_1", domain="algebra", category="overflow", description="Test"
+        )
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(case, "__dict__")
+
+    def test_stress_test_result_timestamp_is_lazy_iso(self):
+        """Timestamp is stored as epoch ns and exported as ISO-8601."""
+        result = StressTestResult(
+            run_id="run-001",
+            scenario_id="scenario-001",
+            case_id="case-001",
+            passed=True,
+            timestamp_ns=1_700_000_000_123_456_000
+        )
+
+        assert result.timestamp == "2023-11-14T22:13:20.123456"
+        data = result.to_dict()
+        assert data["timestamp"] == result.timestamp
+        assert "timestamp_ns" not in data
+
 
 class TestCoverageTracker:
     """Tests for CoverageTracker."""
@@ -299,6 +538,60 @@ class TestCoverageTracker:
         assert stats["passed_runs"] == 4
         assert stats["failure_rate"] == pytest.approx(0.2, abs=0.01)
 
+    def test_record_runs_bulk(self, tracker):
+        """Bulk-recorded runs produce the same stats as individual records."""
+        tracker.record_scenario(
+            scenario_id="test-001",
+            name="Test",
+            category="edge_cases",
+            domain="algebra"
+        )
+        tracker.record_runs_bulk([
+            {
+                "run_id": f"run-{i:03d}",
+                "scenario_id": "test-001",
+                "case_id": f"case-{i}",
+                "passed": i < 3,
+                "confidence": 0.8,
+                "outcome": "success",
+                "budget_used": {"tier": "standard"}
+            }
+            for i in range(4)
+        ])
+        tracker.record_runs_bulk([])
+
+        stats = tracker.get_scenario_stats("test-001")
+        assert stats["total_runs"] == 4
+        assert stats["passed_runs"] == 3
+        assert stats["failure_rate"] == pytest.approx(0.25)
+
+    def test_iter_scenarios_for_promotion(self, tracker):
+        """Streamed scenarios follow report order and carry single-lookup stats."""
+        for scenario_id, domain in [("test-002", "algebra"), ("test-001", "calculus")]:
+            tracker.record_scenario(
+                scenario_id=scenario_id,
+                name=f"Test {scenario_id}",
+                category="edge_cases",
+                domain=domain
+            )
+        tracker.record_run({
+            "run_id": "run-001",
+            "scenario_id": "test-001",
+            "case_id": "case-001",
+            "passed": True,
+            "confidence": 0.85,
+            "outcome": "success",
+            "budget_used": {"tier": "standard"}
+        })
+
+        streamed = list(tracker.iter_scenarios_for_promotion())
+        report = tracker.generate_coverage_report()
+
+        assert [s[0] for s in streamed] == [s["scenario_id"] for s in report["scenarios"]]
+        for scenario_id, name, stats in streamed:
+            assert name == f"Test {scenario_id}"
+            assert stats == tracker.get_scenario_stats(scenario_id)
+
     def test_coverage_report_generation(self, tracker):
         """Generate coverage report."""
         tracker.record_scenario(
@@ -368,6 +661,60 @@ class TestEdgeCaseRegistry:
         overflow_cases = registry.get_cases("algebra", category="overflow")
         assert len(overflow_cases) == 2
 
+    def test_filter_by_category_and_tags(self, registry):
+        """Combined filters intersect and keep registration order."""
+        specs = [
+            ("a", "overflow", ["numeric"]),
+            ("b", "underflow", ["numeric"]),
+            ("c", "overflow", ["polynomial"]),
+            ("d", "overflow", ["numeric", "polynomial"]),
+        ]
+        for case_id, category, tags in specs:
+            registry.register("algebra", EdgeCase(
+                case_id=case_id,
+                domain="algebra",
+                category=category,
+                description="Test",
+                tags=tags
+            ))
+
+        tagged = registry.get_cases("algebra", tags=["numeric"])
+        assert [c.case_id for c in tagged] == ["a", "b", "d"]
+
+        both = registry.get_cases("algebra", category="overflow", tags=["polynomial"])
+        assert [c.case_id for c in both] == ["c", "d"]
+
+        assert registry.get_cases("algebra", tags=["missing"]) == []
+
+    def test_tags_normalized_to_frozenset(self):
+        """List tags are stored as a frozenset and exported sorted."""
+        case = EdgeCase(
+            case_id="case_1",
+            domain="algebra",
+            category="overflow",
+            description="Test",
+            tags=["numeric", "limits", "numeric"]
+        )
+
+        assert case.tags == frozenset({"numeric", "limits"})
+        assert case.to_dict()["tags"] == ["limits", "numeric"]
+
+    def test_overwrite_reindexes_case(self, registry):
+        """Re-registering a case drops its stale category and tags."""
+        registry.register("algebra", EdgeCase(
+            case_id="case_1", domain="algebra", category="overflow",
+            description="Test", tags=["numeric"]
+        ))
+        registry.register("algebra", EdgeCase(
+            case_id="case_1", domain="algebra", category="underflow",
+            description="Test", tags=["polynomial"]
+        ))
+
+        assert registry.get_cases("algebra", category="overflow") == []
+        assert registry.get_cases("algebra", tags=["numeric"]) == []
+        assert len(registry.get_cases("algebra", category="underflow")) == 1
+        assert registry.count_cases("algebra") == 1
+
     def test_list_categories(self, registry):
         """List categories for domain."""
         for category in ["overflow", "underflow", "singularity"]:
@@ -383,6 +730,27 @@ class TestEdgeCaseRegistry:
         categories = registry.list_categories("algebra")
         assert set(categories) == {"overflow", "underflow", "singularity"}
 
+    def test_read_queries_refresh_after_register(self, registry):
+        """Memoized read queries reflect later registrations."""
+        registry.register("algebra", EdgeCase(
+            case_id="case_1", domain="algebra", category="overflow", description="Test"
+        ))
+        assert registry.list_categories("algebra") == ["overflow"]
+        assert registry.count_cases() == 1
+
+        registry.list_categories("algebra").append("mutated")
+        registry.register("calculus", EdgeCase(
+            case_id="case_2", domain="calculus", category="singularity", description="Test"
+        ))
+        registry.register("algebra", EdgeCase(
+            case_id="case_3", domain="algebra", category="underflow", description="Test"
+        ))
+
+        assert registry.list_categories("algebra") == ["overflow", "underflow"]
+        assert registry.list_domains() == ["algebra", "calculus"]
+        assert registry.count_cases() == 3
+        assert registry.count_cases("algebra") == 2
+
     def test_builtin_edge_cases(self):
         """Built-in edge cases are registered."""
         registry = get_edge_case_registry()
@@ -395,6 +763,45 @@ class TestEdgeCaseRegistry:
         assert "overflow_quadratic" in case_ids
         assert "underflow_quadratic" in case_ids
 
+    def test_builtin_generate_returns_fresh_copy(self):
+        """Built-in specs are copied so callers cannot mutate the constant."""
+        case = get_edge_case_registry().get_cases("algebra", category="overflow")[0]
+
+        spec = case.generate()
+        assert isinstance(spec, dict)
+        assert spec["expressions"] == ["x^2 - 1e308*x + 1e307 = 0"]
+
+        spec["type"] = "mutated"
+        spec["expressions"].append("x = 0")
+        fresh = case.generate()
+        assert fresh["type"] == "solve"
+        assert fresh["expressions"] == ["x^2 - 1e308*x + 1e307 = 0"]
+
+    def test_register_edge_case_returns_generator_unchanged(self):
+        """Decorator registers the case and returns the original function."""
+        def generate():
+            return {"type": "solve"}
+
+        decorated = register_edge_case(
+            domain="test_domain",
+            case_id="decorated_case",
+            category="overflow",
+            description="Test"
+        )(generate)
+
+        assert decorated is generate
+        cases = get_edge_case_registry().get_cases("test_domain")
+        assert cases[0].generate() == {"type": "solve"}
+
+    def test_global_registry_is_singleton_across_threads(self):
+        """Concurrent first access yields a single shared registry."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            registries = list(pool.map(lambda _: get_edge_case_registry(), range(32)))
+
+        assert all(r is registries[0] for r in registries)
+
 
 class TestPromotionManager:
     """Tests for StressPromotionManager."""
@@ -491,6 +898,94 @@ class TestPromotionManager:
         assert decision.eligible is True
         assert decision.confidence_score > 0.5
 
+    def test_eligibility_decision_cached_until_stats_change(self, promotion_manager):
+        """Repeated checks reuse the decision until new runs are recorded."""
+        tracker = promotion_manager.tracker
+        tracker.record_scenario(
+            scenario_id="test-001",
+            name="Test",
+            category="edge_cases",
+            domain="algebra"
+        )
+
+        first = promotion_manager.check_promotion_eligibility("test-001", min_runs=1)
+        assert promotion_manager.check_promotion_eligibility("test-001", min_runs=1) is first
+        assert promotion_manager.check_promotion_eligibility("test-001", min_runs=2) is not first
+
+        tracker.record_run({
+            "run_id": "run-001",
+            "scenario_id": "test-001",
+            "case_id": "case-001",
+            "passed": True,
+            "confidence": 0.9,
+            "outcome": "success",
+            "budget_used": {"tier": "standard"}
+        })
+
+        refreshed = promotion_manager.check_promotion_eligibility("test-001", min_runs=1)
+        assert refreshed is not first
+        assert refreshed.stats["total_runs"] == 1
+        assert refreshed.eligible is True
+
+    def test_eligibility_without_reason(self, promotion_manager):
+        """Skipping the reason keeps the checks and is not reused for reasoned calls."""
+        promotion_manager.tracker.record_scenario(
+            scenario_id="test-001",
+            name="Test",
+            category="edge_cases",
+            domain="algebra"
+        )
+
+        bare = promotion_manager.check_promotion_eligibility("test-001", build_reason=False)
+        assert bare.reason == ""
+        assert bare.checks_passed["min_runs"] is False
+
+        full = promotion_manager.check_promotion_eligibility("test-001")
+        assert "Insufficient runs" in full.reason
+        assert full.checks_passed == bare.checks_passed
+
+    def test_no_runs_fast_path_matches_full_evaluation(self, promotion_manager):
+        """Unrun scenarios get the same checks and score as the full evaluation."""
+        promotion_manager.tracker.record_scenario(
+            scenario_id="test-001",
+            name="Test",
+            category="edge_cases",
+            domain="algebra"
+        )
+        stats = promotion_manager.tracker.get_scenario_stats("test-001")
+
+        decision = promotion_manager.check_promotion_eligibility("test-001")
+        full = promotion_manager._build_decision(
+            "test-001", stats, 20, 0.15, 0.60,
+            promotion_manager._compute_confidence_score(stats, 20, 0.15, 0.60)
+        )
+
+        assert decision.eligible is full.eligible is False
+        assert decision.checks_passed == full.checks_passed
+        assert decision.confidence_score == full.confidence_score == 0.0
+        assert "Insufficient runs" in decision.reason
+
+    def test_batch_confidence_scores_match_scalar(self, promotion_manager):
+        """Batch scoring agrees with per-scenario scoring, vectorized or not."""
+        stats_list = [
+            {
+                "total_runs": runs,
+                "failure_rate": failure_rate,
+                "avg_confidence": confidence,
+            }
+            for runs in (0, 5, 20, 40)
+            for failure_rate in (0.0, 0.1, 0.5)
+            for confidence in (0.3, 0.6, 0.95)
+        ]
+        assert len(stats_list) >= StressPromotionManager._VECTORIZE_MIN_SCENARIOS
+
+        scores = promotion_manager._compute_confidence_scores(stats_list, 20, 0.15, 0.60)
+        expected = [
+            promotion_manager._compute_confidence_score(stats, 20, 0.15, 0.60)
+            for stats in stats_list
+        ]
+        assert scores == pytest.approx(expected)
+
     def test_promotion_summary(self, promotion_manager):
         """Get promotion readiness summary."""
         # Create multiple scenarios with different readiness
@@ -522,6 +1017,39 @@ class TestPromotionManager:
         assert "near_promotion_ready" in summary
         assert "not_ready" in summary
 
+    def test_promotion_summary_entries(self, promotion_manager):
+        """Summary buckets hold SummaryEntry objects that serialize to the legacy dicts."""
+        tracker = promotion_manager.tracker
+        for scenario_id in ("ready", "new"):
+            tracker.record_scenario(
+                scenario_id=scenario_id,
+                name=scenario_id.title(),
+                category="edge_cases",
+                domain="algebra"
+            )
+        for i in range(20):
+            tracker.record_run({
+                "run_id": f"run-{i:03d}",
+                "scenario_id": "ready",
+                "case_id": f"case-{i}",
+                "passed": True,
+                "confidence": 0.9,
+                "outcome": "success",
+                "budget_used": {"tier": "standard"}
+            })
+
+        summary = promotion_manager.get_promotion_summary()
+
+        [ready] = summary["ready_for_promotion"]
+        assert isinstance(ready, SummaryEntry)
+        assert ready.to_dict() == {
+            "scenario_id": "ready",
+            "name": "Ready",
+            "confidence_score": ready.confidence_score
+        }
+        assert [entry.scenario_id for entry in summary["not_ready"]] == ["new"]
+        assert summary["promotion_ready_pct"] == 0.5
+
 
 class TestPromotionActions:
     """Tests for PromotionAction system (Phase 0: Close the Causal Loop)."""
@@ -584,6 +1112,21 @@ class TestPromotionActions:
         assert data["old_policy"]["standard"]["max_wall_time_ms"] == 30000
         assert data["new_policy"]["standard"]["max_wall_time_ms"] == 60000
 
+    def test_promotion_action_executed_at_is_lazy_iso(self, eligible_decision):
+        """executed_at is stored as epoch ns and exported as ISO-8601."""
+        from quintet.stress.promotion import PromotionAction
+
+        action = PromotionAction(
+            scenario_id="test-scenario",
+            decision=eligible_decision,
+            action="promote",
+            reason="Test promotion",
+            executed_at_ns=1_700_000_000_123_456_000
+        )
+
+        assert action.executed_at == "2023-11-14T22:13:20.123456"
+        assert action.to_dict()["executed_at"] == action.executed_at
+
     def test_execute_promotion_updates_policy(self, promotion_manager, eligible_decision):
         """Execute promotion actually updates RESOURCE_LIMITS."""
         from quintet.core.types import RESOURCE_LIMITS
@@ -655,6 +1198,22 @@ class TestPromotionActions:
         assert history[0]["action"] == "promote"
         assert history[1]["action"] == "rollback"
 
+    def test_rollback_ignores_edits_to_returned_policy(self, promotion_manager, eligible_decision):
+        """Editing a returned action's old_policy does not change what rollback restores."""
+        from quintet.core.types import RESOURCE_LIMITS
+
+        original_time = RESOURCE_LIMITS["standard"].max_wall_time_ms
+        action = promotion_manager.execute_promotion(
+            scenario_id="test-scenario",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_wall_time_ms": original_time + 10000}}
+        )
+
+        action.old_policy["standard"]["max_wall_time_ms"] = -1
+        promotion_manager.rollback_promotion("test-scenario", reason="Test")
+
+        assert RESOURCE_LIMITS["standard"].max_wall_time_ms == original_time
+
     def test_rollback_without_snapshot_fails(self, promotion_manager):
         """Rollback fails if no snapshot exists."""
         with pytest.raises(ValueError, match="No policy snapshot found"):
@@ -718,6 +1277,30 @@ class TestPromotionActions:
         assert RESOURCE_LIMITS["standard"].max_wall_time_ms == original_standard_time + 5000
         assert action.action == "promote"
 
+    def test_execute_promotion_rejects_unknown_keys(self, promotion_manager, eligible_decision):
+        """Unknown tiers or fields are rejected up front, before anything is applied."""
+        from quintet.core.types import RESOURCE_LIMITS
+
+        before = promotion_manager._snapshot_current_policy()
+
+        with pytest.raises(ValueError) as excinfo:
+            promotion_manager.execute_promotion(
+                scenario_id="scenario-unknown",
+                decision=eligible_decision,
+                policy_changes={
+                    "standard": {"max_plans": 99, "not_a_limit": 1, "__class__": object},
+                    "no_such_tier": {"max_plans": 1},
+                }
+            )
+
+        message = str(excinfo.value)
+        assert "standard.not_a_limit" in message
+        assert "standard.__class__" in message
+        assert "no_such_tier" in message
+        assert promotion_manager._snapshot_current_policy() == before
+        assert not hasattr(RESOURCE_LIMITS["standard"], "not_a_limit")
+        assert promotion_manager.get_promotion_history() == []
+
     def test_promotion_audit_trail(self, promotion_manager, eligible_decision):
         """Promotion history maintains audit trail."""
         # Execute several actions
@@ -740,6 +1323,131 @@ class TestPromotionActions:
             assert "decision" in entry
             assert entry["decision"]["confidence_score"] == 0.85
 
+    def test_promotion_history_entries_are_copies(self, promotion_manager, eligible_decision):
+        """Returned entries are copies with read-only nested values."""
+        promotion_manager.execute_promotion(
+            scenario_id="scenario-0",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_plans": 3}}
+        )
+
+        history = promotion_manager.get_promotion_history()
+        history[0]["action"] = "tampered"
+        with pytest.raises(TypeError):
+            history[0]["decision"]["eligible"] = False
+        with pytest.raises(TypeError):
+            history[0]["new_policy"]["standard"]["max_plans"] = 99
+
+        entry = promotion_manager.get_promotion_history()[0]
+        assert entry["action"] == "promote"
+        assert entry["decision"]["eligible"] is True
+        assert entry["new_policy"]["standard"]["max_plans"] == 3
+
+    def test_promotion_history_persisted_to_jsonl(self, tmp_path, eligible_decision):
+        """With a history file, memory keeps a bounded window and the file keeps everything."""
+        history_path = tmp_path / "promotions.jsonl"
+        manager = StressPromotionManager(
+            CoverageTracker(str(tmp_path / "test.db")),
+            history_path=str(history_path),
+            history_cap=2
+        )
+
+        for i in range(3):
+            manager.execute_promotion(
+                scenario_id=f"scenario-{i}",
+                decision=eligible_decision,
+                policy_changes={"standard": {"max_plans": 3 + i}}
+            )
+        manager.close()
+
+        recent = manager.get_promotion_history()
+        assert [entry["scenario_id"] for entry in recent] == ["scenario-1", "scenario-2"]
+
+        persisted = [json.loads(line) for line in history_path.read_text().splitlines()]
+        assert [entry["scenario_id"] for entry in persisted] == [
+            "scenario-0", "scenario-1", "scenario-2"
+        ]
+        assert persisted[1:] == recent
+
+    def test_promotion_history_written_without_close(self, tmp_path, eligible_decision):
+        """Buffered history reaches the file when the manager is collected unclosed."""
+        history_path = tmp_path / "promotions.jsonl"
+        manager = StressPromotionManager(
+            CoverageTracker(str(tmp_path / "test.db")),
+            history_path=str(history_path)
+        )
+        manager.execute_promotion(
+            scenario_id="scenario-0",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_plans": 3}}
+        )
+        del manager
+        gc.collect()
+
+        persisted = [json.loads(line) for line in history_path.read_text().splitlines()]
+        assert [entry["scenario_id"] for entry in persisted] == ["scenario-0"]
+
+    def test_promotion_history_reloaded_from_file(self, tmp_path, eligible_decision):
+        """A new manager on an existing history file sees its most recent actions."""
+        history_path = tmp_path / "promotions.jsonl"
+        tracker = CoverageTracker(str(tmp_path / "test.db"))
+        manager = StressPromotionManager(tracker, history_path=str(history_path))
+        for i in range(3):
+            manager.execute_promotion(
+                scenario_id=f"scenario-{i}",
+                decision=eligible_decision,
+                policy_changes={"standard": {"max_plans": 3 + i}}
+            )
+        manager.close()
+
+        reopened = StressPromotionManager(tracker, history_path=str(history_path), history_cap=2)
+        history = reopened.get_promotion_history()
+        assert [entry["scenario_id"] for entry in history] == ["scenario-1", "scenario-2"]
+        reopened.close()
+
+    def test_promotion_history_truncated_final_line(self, tmp_path, eligible_decision):
+        """A partial last line from an interrupted write is skipped, not fatal."""
+        history_path = tmp_path / "promotions.jsonl"
+        tracker = CoverageTracker(str(tmp_path / "test.db"))
+        manager = StressPromotionManager(tracker, history_path=str(history_path))
+        manager.execute_promotion(
+            scenario_id="scenario-0",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_plans": 3}}
+        )
+        manager.close()
+        with open(history_path, "a", encoding="utf-8") as f:
+            f.write('{"action_ty')
+
+        reopened = StressPromotionManager(tracker, history_path=str(history_path))
+        assert [entry["scenario_id"] for entry in reopened.get_promotion_history()] == ["scenario-0"]
+
+        reopened.execute_promotion(
+            scenario_id="scenario-1",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_plans": 4}}
+        )
+        reopened.close()
+
+        lines = history_path.read_text(encoding="utf-8").splitlines()
+        assert lines[1] == '{"action_ty'
+        assert json.loads(lines[2])["scenario_id"] == "scenario-1"
+
+    def test_dump_history_and_snapshot_json(self, promotion_manager, eligible_decision):
+        """JSON dumps round-trip to the history and policy snapshot."""
+        promotion_manager.execute_promotion(
+            scenario_id="scenario-0",
+            decision=eligible_decision,
+            policy_changes={"standard": {"max_plans": 3}}
+        )
+
+        assert json.loads(promotion_manager.dump_history_json()) == (
+            promotion_manager.get_promotion_history()
+        )
+        assert json.loads(promotion_manager.dump_snapshot_json()) == (
+            promotion_manager._snapshot_current_policy()
+        )
+
 
 class TestStressDecorator:
     """Tests for stress test decorator."""
@@ -0,0 +1,202 @@
+"""
+Tests for Phase 1 validation: recommendation caching, parse-error details,
+and receipt chaining across runs.
+"""
+
+import importlib.util
+import json
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+
+@dataclass
+class _StubLoomEpisode:
+    """Minimal LoomEpisode: keeps the raw dict."""
+
+    data: dict
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(dict(data))
+
+
+@dataclass
+class _StubPolicyRecommendation:
+    action: str
+    confidence: float
+
+
+def _stub_analyze_episodes(episodes, lever):
+    return _StubPolicyRecommendation(action="hold", confidence=0.5)
+
+
+# phase1 imports quintet.loom_adapter at module level; when the adapter is not
+# installed, stand in a minimal module so these tests still run.
+if importlib.util.find_spec("quintet.loom_adapter") is None:
+    _loom_adapter = ModuleType("quintet.loom_adapter")
+    _loom_adapter.LoomEpisode = _StubLoomEpisode
+    _loom_adapter.PolicyRecommendation = _StubPolicyRecommendation
+    _loom_adapter.analyze_episodes = _stub_analyze_episodes
+    sys.modules.setdefault("quintet.loom_adapter", _loom_adapter)
+
+from quintet.causal.receipt_persistence import ReceiptStore
+from quintet.validation import phase1
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "loom_export_sample.json"
+
+
+@pytest.fixture
+def episodes():
+    """Episode dicts from the sample Loom export."""
+    return json.loads(FIXTURE.read_text())["episodes"]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Isolate the module-level recommendation cache and store cache."""
+    phase1._RECOMMENDATION_CACHE.clear()
+    phase1._STORE_CACHE.clear()
+    yield
+    phase1._RECOMMENDATION_CACHE.clear()
+    phase1._STORE_CACHE.clear()
+
+
+@pytest.fixture
+def analyze_calls(monkeypatch):
+    """Replace analyze_episodes with a recorder returning a fixed recommendation."""
+    calls = []
+
+    def fake_analyze(loom_episodes, lever):
+        calls.append(lever)
+        return SimpleNamespace(action="hold", confidence=0.8)
+
+    monkeypatch.setattr(phase1, "analyze_episodes", fake_analyze)
+    return calls
+
+
+class TestRecommendationCache:
+    """analyze_episodes results are memoized per episode content and lever."""
+
+    def test_repeat_run_hits_cache(self, episodes, analyze_calls):
+        """Identical episodes reuse cached recommendations for every lever."""
+        first = phase1.check_recommendations(episodes)
+        assert first.passed
+        assert len(analyze_calls) == 3
+
+        second = phase1.check_recommendations(json.loads(json.dumps(episodes)))
+        assert len(analyze_calls) == 3
+        assert second.details == first.details
+
+    def test_changed_episodes_miss_cache(self, episodes, analyze_calls):
+        """Editing any episode changes the fingerprint and re-runs analysis."""
+        phase1.check_recommendations(episodes)
+
+        episodes[0]["confidence"] = 0.5
+        phase1.check_recommendations(episodes)
+
+        assert len(analyze_calls) == 6
+
+    def test_errors_are_not_cached(self, episodes, monkeypatch):
+        """A lever that fails is analyzed again on the next run."""
+        calls = []
+
+        def flaky_analyze(loom_episodes, lever):
+            calls.append(lever)
+            if lever == "guardian_strictness" and calls.count(lever) == 1:
+                raise RuntimeError("transient")
+            return SimpleNamespace(action="hold", confidence=0.8)
+
+        monkeypatch.setattr(phase1, "analyze_episodes", flaky_analyze)
+
+        assert not phase1.check_recommendations(episodes).passed
+        assert phase1.check_recommendations(episodes).passed
+        assert calls.count("guardian_strictness") == 2
+        assert calls.count("brain_temperature") == 1
+
+
+class TestEpisodeQuality:
+    """Parse failures are reported as parallel id and message lists."""
+
+    def test_parse_error_details(self, episodes, monkeypatch):
+        """Failed episodes appear in parse_error_ids / parse_error_msgs."""
+        real_convert = phase1._dict_to_loom_episode
+
+        def convert(ep_dict):
+            if ep_dict.get("episode_id") == "ep-002":
+                raise ValueError("bad episode")
+            return real_convert(ep_dict)
+
+        monkeypatch.setattr(phase1, "_dict_to_loom_episode", convert)
+
+        result = phase1.check_episode_quality(episodes)
+
+        assert not result.passed
+        assert result.details["episode_count"] == len(episodes)
+        assert result.details["parse_error_ids"] == ["ep-002"]
+        assert result.details["parse_error_msgs"] == ["bad episode"]
+
+    def test_clean_export_has_empty_parse_errors(self, episodes):
+        """A clean export reports empty parse error lists."""
+        result = phase1.check_episode_quality(episodes)
+
+        assert result.passed
+        assert result.details["parse_error_ids"] == []
+        assert result.details["parse_error_msgs"] == []
+
+
+class TestReceiptChain:
+    """Receipts minted by successive runs form one hash chain."""
+
+    def test_pre_hash_chains_across_runs(self, tmp_path):
+        """Each run's appended hash becomes the next receipt's parent."""
+        first = phase1.check_receipt_chain(store_root=tmp_path)
+        second = phase1.check_receipt_chain(store_root=tmp_path)
+        assert first.passed and second.passed
+
+        receipts = ReceiptStore(storage_path=str(tmp_path / "receipts.jsonl")).read_all_receipts()
+        assert [r.sequence_number for r in receipts] == [1, 2]
+        assert receipts[1].parent_hash == receipts[0].receipt_hash
+        assert first.details["pre_hash_prefix"] == receipts[0].receipt_hash[:16]
+        assert second.details["pre_hash_prefix"] == receipts[1].receipt_hash[:16]
+
+    def test_chain_resumes_with_new_store(self, tmp_path):
+        """A store rebuilt from the file continues the chain from its last hash."""
+        phase1.check_receipt_chain(store_root=tmp_path)
+        phase1._STORE_CACHE.clear()
+        phase1.check_receipt_chain(store_root=tmp_path)
+
+        receipts = ReceiptStore(storage_path=str(tmp_path / "receipts.jsonl")).read_all_receipts()
+        assert receipts[1].parent_hash == receipts[0].receipt_hash
+
+    def test_removed_store_starts_new_chain(self, tmp_path):
+        """Deleting the store directory resets the chain instead of reusing the old head."""
+        store_root = tmp_path / "store"
+        phase1.check_receipt_chain(store_root=store_root)
+        phase1.check_receipt_chain(store_root=store_root)
+
+        shutil.rmtree(store_root)
+        assert phase1.check_receipt_chain(store_root=store_root).passed
+
+        receipts = ReceiptStore(storage_path=str(store_root / "receipts.jsonl")).read_all_receipts()
+        assert [r.sequence_number for r in receipts] == [1]
+        assert receipts[0].parent_hash is None
+
+    def test_cache_keyed_on_resolved_path(self, tmp_path, monkeypatch):
+        """A relative store root is resolved against the working directory at call time."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / "a")
+        phase1.check_receipt_chain(store_root=Path("store"))
+        monkeypatch.chdir(tmp_path / "b")
+        phase1.check_receipt_chain(store_root=Path("store"))
+
+        for name in ("a", "b"):
+            path = tmp_path / name / "store" / "receipts.jsonl"
+            receipts = ReceiptStore(storage_path=str(path)).read_all_receipts()
+            assert [r.sequence_number for r in receipts] == [1]
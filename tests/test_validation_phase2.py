@@ -0,0 +1,170 @@
+"""
+Tests for Phase 2 validation against a local fake Loom/Quintet server:
+call-log polling, the short-body shortcut, and retry behaviour.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+pytest.importorskip("requests")
+
+from quintet.validation import phase2
+
+
+class FakeServer:
+    """Serves /health, /api/episodes and /api/calls from scripted responses.
+
+    health_statuses and episode_statuses are consumed one per request, then
+    200 / 201 repeat. calls_bodies is consumed one per /api/calls poll, and
+    its last entry repeats.
+    """
+
+    def __init__(self):
+        self.health_statuses = []
+        self.episode_statuses = []
+        self.calls_bodies = [b'{"calls":[{"call_id":"c-1"}]}']
+        self.hits = {"health": 0, "episodes": 0, "calls": 0}
+
+    def respond(self, method, path):
+        if method == "GET" and path == "/health":
+            self.hits["health"] += 1
+            status = self.health_statuses.pop(0) if self.health_statuses else 200
+            return status, b'{"status":"ok"}'
+        if method == "POST" and path == "/api/episodes":
+            self.hits["episodes"] += 1
+            status = self.episode_statuses.pop(0) if self.episode_statuses else 201
+            return status, b'{"episode_id":"ep-1"}'
+        if method == "GET" and path == "/api/calls":
+            self.hits["calls"] += 1
+            body = self.calls_bodies.pop(0) if len(self.calls_bodies) > 1 else self.calls_bodies[0]
+            return 200, body
+        return 404, b"{}"
+
+
+@pytest.fixture
+def fake_server():
+    """Run a FakeServer over HTTP/1.1 on an ephemeral local port."""
+    server_state = FakeServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self, method):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            status, body = server_state.respond(method, urlparse(self.path).path)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    server_state.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield server_state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestLivePathPolling:
+    """check_live_path polls /api/calls until a call appears or time runs out."""
+
+    def test_call_found_after_empty_polls(self, fake_server):
+        """Empty polls back off until the call is logged."""
+        fake_server.calls_bodies = [
+            b'{"calls":[]}',
+            b'{"calls":[]}',
+            b'{"calls":[{"call_id":"c-1"}]}',
+        ]
+
+        result = phase2.check_live_path(fake_server.url, fake_server.url, timeout_sec=5)
+
+        assert result.passed
+        assert result.details["calls_observed"] == 1
+        assert result.details["sample_call"] == {"call_id": "c-1"}
+        assert fake_server.hits["calls"] == 3
+
+    def test_timeout_when_no_calls_logged(self, fake_server):
+        """With no calls logged, the check fails once timeout_sec elapses."""
+        fake_server.calls_bodies = [b'{"calls":[]}']
+
+        start = time.monotonic()
+        result = phase2.check_live_path(fake_server.url, fake_server.url, timeout_sec=1)
+        elapsed = time.monotonic() - start
+
+        assert not result.passed
+        assert result.errors == ["No Quintet calls recorded for test episode"]
+        assert result.warnings == ["No calls recorded within 1s"]
+        assert result.details["calls_observed"] == 0
+        assert 1.0 <= elapsed < 3.0
+
+    def test_short_nonempty_calls_body_is_decoded(self, fake_server):
+        """A body exactly at the non-empty minimum is decoded, not skipped."""
+        body = b'{"calls":[7]}'
+        assert len(body) == phase2._MIN_NONEMPTY_CALLS_BYTES
+        fake_server.calls_bodies = [body]
+
+        result = phase2.check_live_path(fake_server.url, fake_server.url, timeout_sec=1)
+
+        assert result.passed
+        assert result.details["sample_call"] == 7
+        assert fake_server.hits["calls"] == 1
+
+
+class TestRetries:
+    """Gateway errors are retried for GET but never for episode creation."""
+
+    def test_get_retried_after_gateway_error(self, fake_server):
+        """A 503 from a health check is retried and the check proceeds."""
+        fake_server.health_statuses = [503]
+
+        result = phase2.check_live_path(fake_server.url, fake_server.url, timeout_sec=2)
+
+        assert result.passed
+        # Loom health retried once, then Quintet health
+        assert fake_server.hits["health"] == 3
+
+    def test_episode_post_not_retried(self, fake_server):
+        """A 503 on episode creation is reported, not retried."""
+        fake_server.episode_statuses = [503]
+
+        result = phase2.check_live_path(fake_server.url, fake_server.url, timeout_sec=2)
+
+        assert not result.passed
+        assert result.errors == ["Failed to trigger test episode: 503"]
+        assert fake_server.hits["episodes"] == 1
+
+
+class TestJsonDecoding:
+    """_json decodes bodies and raises requests' decode error on bad JSON."""
+
+    def test_invalid_body_raises_request_exception(self, fake_server):
+        """Malformed bodies surface as a RequestException subclass."""
+        fake_server.calls_bodies = [b'{"calls": [oops]}']
+        resp = phase2._SESSION.get(fake_server.url + "/api/calls", timeout=2)
+
+        with pytest.raises(phase2.requests.RequestException):
+            phase2._json(resp)
+
+    def test_valid_body(self, fake_server):
+        """Well-formed bodies decode to the same value as json.loads."""
+        resp = phase2._SESSION.get(fake_server.url + "/api/calls", timeout=2)
+
+        assert phase2._json(resp) == json.loads(fake_server.calls_bodies[0])